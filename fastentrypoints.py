@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Fast console-script generation for setup.py installs.
+
+Patches setuptools' easy_install ScriptWriter so generated console scripts
+import the entry point directly instead of resolving it through
+pkg_resources, which scans every installed distribution at startup.
+Adapted from the fastentrypoints project (BSD-2-Clause).
+"""
+
+import re
+
+try:
+    from setuptools.command import easy_install
+except ImportError:  # setuptools without easy_install: nothing to patch
+    easy_install = None
+
+TEMPLATE = r"""
+# -*- coding: utf-8 -*-
+# EASY-INSTALL-ENTRY-SCRIPT: '{3}','{4}','{5}'
+__requires__ = '{3}'
+import re
+import sys
+
+from {0} import {1}
+
+if __name__ == '__main__':
+    sys.argv[0] = re.sub(r'(-script\.pyw?|\.exe)?$', '', sys.argv[0])
+    sys.exit({2}())
+""".lstrip()
+
+
+@classmethod
+def get_args(cls, dist, header=None):
+    """Yield write_script() argument tuples for a distribution's entry points."""
+    if header is None:
+        header = cls.get_header()
+    spec = str(dist.as_requirement())
+    for type_ in "console", "gui":
+        group = type_ + "_scripts"
+        for name, ep in dist.get_entry_map(group).items():
+            if re.search(r"[\\/]", name):
+                raise ValueError("Path separators not allowed in script names")
+            script_text = TEMPLATE.format(
+                ep.module_name, ep.attrs[0], ".".join(ep.attrs), spec, group, name
+            )
+            yield from cls._get_script_args(type_, name, header, script_text)
+
+
+if easy_install is not None:
+    easy_install.ScriptWriter.get_args = get_args
@@ -1,123 +1,39 @@
 #!/usr/bin/env python3
 """
-Setup script for Claude RAG Toolkit
+Setup script for Claude RAG Toolkit.
+Package metadata lives in pyproject.toml; this shim only installs build hooks.
 """
 
-from setuptools import setup, find_packages
+import compileall
+import sys
 from pathlib import Path
 
-# Read the README file
-long_description = (Path(__file__).parent / "README.md").read_text()
+from setuptools import setup
+from setuptools.command.install import install as _install
 
-setup(
-    name="claude-rag-toolkit",
-    version="1.0.0",
-    description="Multi-repository documentation management system for Claude Code",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    author="Claude RAG Toolkit Team",
-    author_email="noreply@example.com",
-    url="https://github.com/yourusername/claude-rag-toolkit",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    python_requires=">=3.8",
-    install_requires=[
-        # Full package by default - includes all enhancements
-        "rich>=13.0.0",                   # Better terminal output, tables, progress bars
-        "click>=8.0.0",                   # Enhanced CLI argument parsing
-        "pydantic>=2.0.0",                # Configuration validation and data models
-        "orjson>=3.9.0",                  # Faster JSON parsing for large files
-        "rapidfuzz>=3.0.0",               # Better fuzzy matching for search
-        "PyPDF2>=3.0.0",                  # PDF text extraction
-        "pdfplumber>=0.9.0",              # Advanced PDF parsing
-        "sentence-transformers>=2.2.0",   # Local embedding models
-        "numpy>=1.21.0",                  # Vector operations
-        "scikit-learn>=1.0.0",            # Similarity calculations
-    ],
-    extras_require={
-        # Minimal installation - no dependencies (for lightweight deployments)
-        "minimal": [
-            # No dependencies - uses Python standard library only
-        ],
-        
-        # Enhanced CLI experience with rich output and progress bars
-        "rich": [
-            "rich>=13.0.0",           # Better terminal output, tables, progress bars
-            "click>=8.0.0",           # Enhanced CLI argument parsing
-        ],
-        
-        # Performance and validation enhancements
-        "enhanced": [
-            "pydantic>=2.0.0",        # Configuration validation and data models
-            "orjson>=3.9.0",          # Faster JSON parsing for large files
-            "rapidfuzz>=3.0.0",       # Better fuzzy matching for search
-        ],
-        
-        # PDF processing support
-        "pdf": [
-            "PyPDF2>=3.0.0",              # PDF text extraction
-            "pdfplumber>=0.9.0",          # Advanced PDF parsing
-        ],
-        
-        # Semantic search with embeddings
-        "embeddings": [
-            "sentence-transformers>=2.2.0",   # Local embedding models
-            "numpy>=1.21.0",                  # Vector operations
-            "scikit-learn>=1.0.0",            # Similarity calculations
-        ],
-        
-        # MCP protocol support (future)
-        "mcp": [
-            # Commented out since these packages don't exist yet
-            # "mcp>=1.0.0",
-            # "orjson>=3.9.0",
-        ],
-        
-        # Development dependencies
-        "dev": [
-            "pytest>=7.0.0",
-            "pytest-cov>=4.0.0",
-            "pytest-mock>=3.10.0", 
-            "black>=22.0.0",
-            "flake8>=4.0.0",
-            "flake8-docstrings>=1.7.0",
-            "pre-commit>=3.0.0",
-        ],
-        
-        # Testing only
-        "test": [
-            "pytest>=7.0.0",
-            "pytest-cov>=4.0.0",
-            "pytest-mock>=3.10.0",
-            "pytest-asyncio>=0.21.0",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "claude-rag=cli:main",
-        ],
-    },
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Topic :: Software Development :: Documentation",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Text Processing :: Indexing",
-    ],
-    keywords=[
-        "claude", "documentation", "rag", "search", "knowledge-management",
-        "multi-repository", "mlops", "machine-learning", "ansible", "kubernetes"
-    ],
-    project_urls={
-        "Bug Reports": "https://github.com/yourusername/claude-rag-toolkit/issues",
-        "Source": "https://github.com/yourusername/claude-rag-toolkit",
-        "Documentation": "https://github.com/yourusername/claude-rag-toolkit/blob/main/README.md",
-    },
-)
\ No newline at end of file
+
+class install(_install):
+    """Install command that byte-compiles the installed modules up front.
+
+    Writes both plain and -O bytecode (or the level given by --optimize) so
+    the first ``claude-rag`` run after install never pays for .py -> .pyc
+    compilation. Honours --no-compile and bdist_wheel, which turns
+    compilation off so wheels stay free of interpreter-specific bytecode.
+    """
+
+    def run(self):
+        super().run()
+        # install_lib resolves compile/optimize from this command's options
+        lib = self.get_finalized_command("install_lib")
+        if not lib.compile:
+            return
+        levels = [0, lib.optimize] if lib.optimize else [0, 1]
+        compileall.compile_dir(self.install_lib, quiet=1, optimize=levels)
+
+
+if __name__ == "__main__":
+    # Tools that import setup.py for inspection skip the build hooks entirely
+    sys.path.insert(0, str(Path(__file__).parent))
+    import fastentrypoints  # noqa: F401 - generate direct-import console scripts
+
+    setup(cmdclass={"install": install})
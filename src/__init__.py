@@ -2,11 +2,16 @@
 Claude RAG Toolkit - Multi-repository documentation management system.
 """
 
-__version__ = "1.0.0"
+from .utils._version import __version__
+from .utils._lazy import attach
+
 __author__ = "Claude RAG Toolkit Team"
 __description__ = "Multi-repository documentation management system for Claude Code"
 
-from .core.rag_engine import MultiRepoRAGEngine
-from .utils.repo_detector import RepositoryDetector
+_SUBMOD_ATTRS = {
+    "core.rag_engine": ["MultiRepoRAGEngine"],
+    "utils.repo_detector": ["RepositoryDetector"],
+}
 
-__all__ = ["MultiRepoRAGEngine", "RepositoryDetector"]
\ No newline at end of file
+# Public classes are imported on first access to keep package import cheap
+__getattr__, __dir__, __all__ = attach(__name__, _SUBMOD_ATTRS)
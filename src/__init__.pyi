@@ -0,0 +1,7 @@
+from .core.rag_engine import MultiRepoRAGEngine as MultiRepoRAGEngine
+from .utils.repo_detector import RepositoryDetector as RepositoryDetector
+
+__version__: str
+__author__: str
+__description__: str
+__all__: list[str]
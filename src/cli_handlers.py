@@ -0,0 +1,843 @@
+#!/usr/bin/env python3
+"""
+Claude RAG Toolkit CLI command handlers.
+Loaded by cli.py only when a command is dispatched, so `claude-rag --help`
+never imports this module or anything it pulls in.
+"""
+
+import contextlib
+import functools
+import os
+import sys
+from collections import defaultdict
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+try:
+    from cli import _load
+except ImportError:
+    from .cli import _load
+
+if TYPE_CHECKING:
+    from core.rag_engine import MultiRepoRAGEngine
+    from utils.session_manager import SessionManager
+
+
+# Fetch several fields per match/session in one C-level call
+_LOCATION_FIELDS = itemgetter('file', 'line')
+_COMMAND_FIELDS = itemgetter('file', 'line', 'type', 'command')
+_SESSION_FIELDS = itemgetter('session_id', 'name', 'start_time')
+
+
+def _location(match: dict) -> str:
+    return "[%s:%s]" % _LOCATION_FIELDS(match)
+
+
+# (--category choice, result key, heading line, line formatter) in display order.
+# Formatters subscript the fields MultiRepoRAGEngine.search always emits.
+_SEARCH_CATEGORIES = (
+    ('concepts', 'concept_matches', "\n💡 Concept:",
+     lambda m: f"{_location(m)} {m['concept']}"),
+    ('commands', 'command_matches', "\n⚡ Command:",
+     lambda m: f"{_location(m)} {m['command']}"),
+    ('configurations', 'configuration_matches', "\n⚙️ Configuration:",
+     lambda m: f"{_location(m)} {m['content'][:80]}..."),
+    ('troubleshooting', 'troubleshooting_matches', "\n🔧 Troubleshooting:",
+     lambda m: f"{_location(m)} ({m['type']}) {m['content'][:80]}..."),
+    (None, 'semantic_matches', "\n🧠 Semantic:",
+     lambda m: f"[{m['file']}] (similarity: {m['similarity']:.3f})"),
+)
+
+# (match type, heading, entries shown) in display order for cmd_troubleshoot
+_TROUBLESHOOT_SECTIONS = (
+    ('error', "\n❌ Known Errors:", 3),
+    ('solution', "\n✅ Solutions:", 5),
+    ('issue', "\n⚠️  Related Issues:", 3),
+)
+
+# git status letter -> icon for cmd_recent
+_CHANGE_ICONS = {'A': "➕", 'M': "✏️", 'D': "➖"}
+
+# (status, icon, heading) in display order for session_list
+_SESSION_STATUSES = (
+    ('active', '🟢', 'Active'),
+    ('paused', '🟡', 'Paused'),
+    ('completed', '✅', 'Completed'),
+    ('cancelled', '❌', 'Cancelled'),
+)
+
+
+def cmd_init(cli, args) -> int:
+    """Initialize RAG system in current project."""
+    project_root = Path(cli._root).resolve()
+    rag_dir = project_root / '.claude-rag'
+    config_path = rag_dir / 'config.json'
+
+    # Check if already initialized
+    if config_path.exists() and not args.force:
+        print(f"✅ RAG system already initialized in {project_root}")
+        print(f"📄 Configuration: {config_path}")
+        print("💡 Use --force to reinitialize")
+        return 0
+
+    print(f"🚀 Initializing RAG system in: {project_root}")
+
+    # Initialize RAG engine (will auto-detect repo type and create config)
+    MultiRepoRAGEngine = _load('core.rag_engine', 'MultiRepoRAGEngine')
+    engine = cli._engine = MultiRepoRAGEngine(str(project_root))
+
+    # Override repo type if specified (though it's always universal now);
+    # a re-init with the type already on disk leaves config.json untouched
+    if args.repo_type:
+        config = engine.config
+        if config.get('repo_type') != args.repo_type:
+            config['repo_type'] = args.repo_type
+            dumps = _load('utils._json', 'dumps')
+            _write_atomic(config_path, dumps(config, indent=True))
+        print(f"🔧 Repository type: {args.repo_type}")
+
+    # Run initial indexing
+    print("📚 Running initial indexing...")
+    results = engine.index_project()
+
+    print(f"✅ RAG system initialized successfully!")
+    print(f"📁 Configuration: {config_path}")
+    print(f"📊 Indexed {results['indexed_files']} files")
+
+    # Add gitignore entry for generated files
+    gitignore_path = project_root / '.gitignore'
+    gitignore_entries = [
+        ".claude-rag/index.json",
+        ".claude-rag/cache.json", 
+        ".claude-rag/config.json",
+        ".claude-rag/embeddings/",
+        ".claude-rag/*.tmp",
+        ".claude-rag/*.log"
+    ]
+    gitignore_entry = "\n".join(gitignore_entries) + "\n"
+
+    if gitignore_path.exists():
+        # One handle for both the scan and the append; writes in 'a+' mode
+        # always land at the end of the file
+        with open(gitignore_path, 'a+', encoding='utf-8') as f:
+            f.seek(0)
+            missing_entries = list(gitignore_entries)
+            has_rag_section = False
+            for line in f:
+                if '.claude-rag/' not in line:
+                    continue
+                has_rag_section = True
+                missing_entries = [entry for entry in missing_entries if entry not in line]
+                if not missing_entries:
+                    break
+
+            if missing_entries:
+                if not has_rag_section:
+                    # First time adding Claude RAG entries
+                    f.write(f"\n# Claude RAG generated files\n")
+                for entry in missing_entries:
+                    f.write(f"{entry}\n")
+
+        if missing_entries:
+            print(f"📝 Added {len(missing_entries)} Claude RAG entries to .gitignore")
+        else:
+            print("✅ .gitignore already has all Claude RAG entries")
+    else:
+        with open(gitignore_path, 'w', encoding='utf-8') as f:
+            f.write(f"# Claude RAG generated files\n{gitignore_entry}")
+        print("📝 Created .gitignore with RAG entries")
+
+    return 0
+
+
+def _emit_json(data) -> None:
+    """Write data as one line of JSON, bypassing the human-readable formatting."""
+    dumps = _load('utils._json', 'dumps')
+    payload = dumps(data) + b"\n"
+    stream = getattr(sys.stdout, 'buffer', None)
+    if stream is None:
+        sys.stdout.write(payload.decode('utf-8'))
+    else:
+        sys.stdout.flush()
+        stream.write(payload)
+        stream.flush()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace path with data so readers never see a partially written file.
+
+    The replacement keeps path's permissions; a new file gets the usual
+    0o666 & ~umask instead of NamedTemporaryFile's 0o600.
+    """
+    import stat
+    import tempfile  # only init writes config, keep it off the common import path
+
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp',
+                                     delete=False) as tmp:
+        tmp.write(data)
+    try:
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
+
+
+def cmd_search(cli, args) -> int:
+    """Search documentation."""
+    engine = get_engine(cli)
+    if not engine:
+        return 1
+
+    results = engine.search(args.query, args.limit)
+
+    categories = _SEARCH_CATEGORIES
+    if args.category:
+        categories = [entry for entry in categories if entry[0] == args.category]
+
+    if getattr(args, 'json', False):
+        _emit_json({key: results[key] for _, key, _, _ in categories})
+        return 0
+
+    # Collect the whole listing and write it once rather than once per match
+    lines = [f"🔍 Search results for: '{args.query}'", "=" * 60]
+    total_results = 0
+    for _, key, heading, format_match in categories:
+        matches = results[key]
+        if matches:
+            lines.append(heading)
+            lines.extend(f"  {i}. {format_match(match)}" for i, match in enumerate(matches, 1))
+
+            total_results += len(matches)
+
+    if total_results == 0:
+        lines.append("❌ No results found")
+        lines.append("💡 Try different keywords or run 'claude-rag reindex' to update the index")
+    else:
+        lines.append(f"\n📊 Total results: {total_results}")
+
+    print("\n".join(lines))
+    return 0
+
+
+def cmd_context(cli, args) -> int:
+    """Get file context and relationships."""
+    engine = get_engine(cli)
+    if not engine:
+        return 1
+
+    context = engine.get_file_context(args.filepath)
+
+    if getattr(args, 'json', False):
+        _emit_json(context)
+        return 1 if 'error' in context else 0
+
+    if 'error' in context:
+        print(f"❌ {context['error']}")
+        return 1
+
+    print(f"📄 Context for: {args.filepath}")
+    print("=" * 60)
+
+    # File info
+    file_info = context['file_info']
+    print(f"📊 File Info:")
+    print(f"  Size: {file_info['size']} bytes")
+    print(f"  Lines: {file_info['lines']}")
+    print(f"  Type: {file_info['type']}")
+    print(f"  Last indexed: {file_info['last_indexed']}")
+
+    # Concepts
+    concepts = context['concepts']
+    if concepts:
+        print(f"\n💡 Key Concepts:")
+        for concept in concepts[:5]:
+            print(f"  • {concept['name']} (line {concept['line']})")
+
+    # Commands
+    commands = context['commands']
+    if commands:
+        print(f"\n⚡ Commands Found:")
+        for cmd in commands[:5]:
+            print(f"  • [{cmd['type']}] {cmd['command'][:60]}...")
+
+    # Related files
+    related = context['related_files']
+    if related:
+        print(f"\n🔗 Related Files:")
+        for related_file in related:
+            print(f"  • {related_file}")
+
+    return 0
+
+
+def cmd_troubleshoot(cli, args) -> int:
+    """Find troubleshooting information."""
+    engine = get_engine(cli)
+    if not engine:
+        return 1
+
+    results = engine.search(args.error, limit=20)
+    troubleshooting = results['troubleshooting_matches']
+
+    if getattr(args, 'json', False):
+        _emit_json(troubleshooting)
+        return 0
+
+    print(f"🔧 Troubleshooting: '{args.error}'")
+    print("=" * 60)
+
+    if not troubleshooting:
+        print("❌ No troubleshooting information found")
+        print("💡 Try different keywords or check if the issue is documented")
+        return 0
+
+    # Group by type in one pass; other types are dropped
+    buckets = {'error': [], 'solution': [], 'issue': []}
+    for entry in troubleshooting:
+        bucket = buckets.get(entry['type'])
+        if bucket is not None:
+            bucket.append(entry)
+
+    for kind, heading, shown in _TROUBLESHOOT_SECTIONS:
+        entries = buckets[kind]
+        if entries:
+            lines = [heading]
+            for i, entry in enumerate(entries[:shown], 1):
+                lines.append(f"  {i}. [{entry['file']}:{entry['line']}]")
+                lines.append(f"     {entry['content'][:100]}...")
+            print("\n".join(lines))
+
+    return 0
+
+
+def cmd_commands(cli, args) -> int:
+    """List commands for specific technology."""
+    engine = get_engine(cli)
+    if not engine:
+        return 1
+
+    # The engine applies the technology filter while scanning the index
+    results = engine.search(args.technology, limit=args.limit, command_tech=args.technology)
+    tech_commands = results['command_matches']
+
+    if getattr(args, 'json', False):
+        _emit_json(tech_commands)
+        return 0
+
+    print(f"⚡ Commands for '{args.technology}':")
+    print("=" * 60)
+
+    if not tech_commands:
+        print("❌ No commands found")
+        return 0
+
+    lines = []
+    for i, (file, line, cmd_type, command) in enumerate(map(_COMMAND_FIELDS, tech_commands), 1):
+        lines.append(f"  {i}. [{file}:{line}] ({cmd_type})")
+        lines.append(f"     {command}")
+    lines.append(f"\n📊 Found {len(tech_commands)} commands")
+    print("\n".join(lines))
+    return 0
+
+
+def cmd_recent(cli, args) -> int:
+    """Show recent documentation changes."""
+    index = get_index_meta(cli)
+    if index is None:
+        return 1
+
+    changes = index.get('recent_changes', [])
+
+    if getattr(args, 'json', False):
+        _emit_json(changes)
+        return 0
+
+    print("📝 Recent Documentation Changes:")
+    print("=" * 60)
+
+    if not changes:
+        print("❌ No recent changes tracked")
+        print("💡 Changes are tracked via git history")
+        return 0
+
+    lines = []
+    for change in changes:
+        status = change.get('status', '?')
+        file = change.get('file', 'Unknown')
+        timestamp = change.get('timestamp', '')
+
+        status_icon = _CHANGE_ICONS.get(status, "❓")
+        lines.append(f"{status_icon} {file} ({timestamp[:10]})")
+
+    print("\n".join(lines))
+    return 0
+
+
+def cmd_stats(cli, args) -> int:
+    """Show index statistics."""
+    index = get_index_meta(cli)
+    if index is None:
+        return 1
+
+    stats = index.get('statistics', {})
+    repo_type = index.get('repo_type', 'unknown')
+    last_indexed = index.get('last_indexed', 'Never')
+
+    if getattr(args, 'json', False):
+        _emit_json({
+            'repo_type': repo_type,
+            'last_indexed': last_indexed,
+            'statistics': stats,
+            'recent_changes': len(index.get('recent_changes', [])),
+        })
+        return 0
+
+    print("\n".join((
+        "📊 Documentation Index Statistics:",
+        "=" * 60,
+        f"Repository Type: {repo_type}",
+        f"Last Indexed: {last_indexed}",
+        f"Files Indexed: {stats.get('total_files', 0)}",
+        f"Commands Extracted: {stats.get('total_commands', 0)}",
+        f"Concepts Identified: {stats.get('total_concepts', 0)}",
+        f"Configurations Found: {stats.get('total_configurations', 0)}",
+        f"Troubleshooting Entries: {stats.get('total_troubleshooting', 0)}",
+        f"Knowledge Graph Nodes: {stats.get('knowledge_graph_nodes', 0)}",
+        f"Recent Changes: {len(index.get('recent_changes', []))}",
+    )))
+
+    return 0
+
+
+def cmd_reindex(cli, args) -> int:
+    """Rebuild documentation index."""
+    engine = get_engine(cli)
+    if not engine:
+        return 1
+
+    print("🔄 Rebuilding documentation index...")
+
+    # Show patterns being used if verbose
+    if args.verbose:
+        print(f"📋 Repository type: {engine.config.get('repo_type', 'unknown')}")
+        print(f"📁 File patterns:")
+        for pattern in engine.config.get('file_patterns', []):
+            print(f"   - {pattern}")
+        print(f"🚫 Exclude patterns:")
+        for exclude in engine.config.get('exclude_paths', []):
+            print(f"   - {exclude}")
+        print()
+
+    results = engine.index_project(force_reindex=args.force, verbose=args.verbose)
+
+    print(f"✅ Reindexing complete!")
+    print(f"📊 Processed: {results['indexed_files']} files")
+    print(f"📁 Total files: {results['total_files']} files")
+
+    if args.verbose and 'skipped_files' in results:
+        print(f"⏭️  Skipped: {results['skipped_files']} files")
+
+    return 0
+
+
+def cmd_info(cli, args) -> int:
+    """Show repository information."""
+    RepositoryDetector = _load('utils.repo_detector', 'RepositoryDetector')
+    detector = RepositoryDetector(cli._root)
+    if getattr(args, 'json', False):
+        # The detector reports its guess on stdout; keep that off the JSON stream
+        with contextlib.redirect_stdout(sys.stderr):
+            info = detector.get_repository_info()
+        _emit_json(info)
+        return 0
+
+    info = detector.get_repository_info()
+
+    print("📋 Repository Information:")
+    print("=" * 60)
+    print(f"Project Root: {info['project_root']}")
+    print(f"Detected Type: {info['detected_type']}")
+
+    if info['git_info'].get('remote'):
+        print(f"Git Remote: {info['git_info']['remote']}")
+
+    print(f"\n📁 Directory Structure:")
+    for directory in info['directory_structure']:
+        print(f"  • {directory}/")
+
+    print(f"\n📄 File Types:")
+    for ext, count in list(info['file_counts'].items())[:5]:
+        print(f"  • {ext}: {count} files")
+
+    return 0
+
+
+def cmd_setup_mcp(cli, args) -> int:
+    """Setup MCP server configuration."""
+    dumps = _load('utils._json', 'dumps')
+    loads = _load('utils._json', 'loads')
+
+    print("🔧 Setting up MCP server configuration...")
+
+    # Get Claude config directory
+    if args.claude_config_dir:
+        config_dir = Path(args.claude_config_dir)
+    else:
+        # Try common locations
+        config_dir = next((d for d in _claude_config_candidates() if d.exists()), None)
+
+        if not config_dir:
+            print("❌ Could not find Claude configuration directory")
+            print("💡 Please specify with --claude-config-dir")
+            return 1
+
+    # Ensure MCP config file exists
+    mcp_config_file = config_dir / "mcp.json"
+
+    if mcp_config_file.exists():
+        print(f"📄 Found existing MCP config: {mcp_config_file}")
+        mcp_config = loads(mcp_config_file.read_bytes())
+    else:
+        print(f"📝 Creating new MCP config: {mcp_config_file}")
+        mcp_config = {"servers": {}}
+
+    # Get project and toolkit paths
+    project_root = Path(cli._root).resolve()
+    toolkit_path = _toolkit_path()
+
+    # Create server configuration
+    server_config = {
+        "command": "python3",
+        "args": [
+            str(toolkit_path / "src" / "integrations" / "mcp_server_enhanced.py"),
+            "--project-root", str(project_root)
+        ],
+        "env": {
+            "PYTHONPATH": str(toolkit_path / "src")
+        }
+    }
+
+    # Add to MCP config
+    project_name = project_root.name
+    server_key = f"claude-rag-{project_name}"
+
+    mcp_config["servers"][server_key] = server_config
+
+    # Save config
+    config_dir.mkdir(parents=True, exist_ok=True)
+    mcp_config_file.write_bytes(dumps(mcp_config, indent=True))
+
+    print(f"✅ MCP server configured: {server_key}")
+    print(f"📁 Project root: {project_root}")
+    print(f"🔧 Toolkit path: {toolkit_path}")
+    print()
+    print("📋 Configuration added to:", mcp_config_file)
+    print()
+    print("🚀 Next steps:")
+    print("1. Restart Claude Code to load the new configuration")
+    print("2. The RAG tools will be available in your conversation")
+    print()
+    print("💡 Available tools:")
+    print("  - search_documentation: Search project knowledge base")
+    print("  - troubleshoot_error: Find error solutions")
+    print("  - get_file_context: Get file relationships")
+    print("  - get_related_commands: Find technology commands")
+    print("  - get_project_stats: View index statistics")
+    print("  - reindex_project: Update documentation index")
+
+    return 0
+
+
+@functools.cache
+def _toolkit_path() -> Path:
+    """Checkout root of the toolkit (the directory above src/), resolved once."""
+    return Path(__file__).resolve().parent.parent
+
+
+def _claude_config_candidates() -> list:
+    """Likely Claude configuration directories for this platform, most specific first."""
+    home = Path.home()
+    candidates = []
+    xdg_config_home = os.environ.get('XDG_CONFIG_HOME')
+    if xdg_config_home:
+        candidates.append(Path(xdg_config_home) / "claude")
+    elif sys.platform != 'win32':
+        candidates.append(home / ".config" / "claude")
+    candidates.append(home / ".claude")
+    if sys.platform == 'darwin':
+        candidates.append(home / "Library" / "Application Support" / "Claude")
+    return candidates
+
+
+def get_engine(cli) -> Optional["MultiRepoRAGEngine"]:
+    """Get initialized RAG engine, loading it at most once per CLI instance."""
+    if cli._engine is not None:
+        return cli._engine
+    MultiRepoRAGEngine = _load('core.rag_engine', 'MultiRepoRAGEngine')
+    try:
+        cli._engine = MultiRepoRAGEngine(cli._root)
+        return cli._engine
+    except Exception as e:
+        print(f"❌ RAG system not initialized: {e}")
+        print("💡 Run 'claude-rag init' to initialize")
+        return None
+
+
+def get_index_meta(cli) -> Optional[dict]:
+    """Get the index summary fields without constructing the full engine."""
+    if cli._engine is not None:
+        return cli._engine.index
+    MultiRepoRAGEngine = _load('core.rag_engine', 'MultiRepoRAGEngine')
+    index_file = Path(cli._root) / '.claude-rag' / 'index.json'
+    try:
+        return MultiRepoRAGEngine.load_meta_only(index_file)
+    except Exception as e:
+        print(f"❌ RAG system not initialized: {e}")
+        print("💡 Run 'claude-rag init' to initialize")
+        return None
+
+
+def session_start(session_manager: "SessionManager", args) -> int:
+    """Start a new development session."""
+    try:
+        session = session_manager.start_session(
+            name=args.name,
+            description=args.description or "",
+            objectives=args.objectives or []
+        )
+
+        print(f"🚀 Started session: {session.name}")
+        print(f"📅 Session ID: {session.session_id}")
+        print(f"🌿 Git branch: {session.initial_branch}")
+        print(f"📝 Initial commit: {session.initial_commit[:8]}")
+
+        if session.objectives:
+            print(f"🎯 Objectives:")
+            for i, obj in enumerate(session.objectives, 1):
+                print(f"  {i}. {obj}")
+
+        print("\n💡 Use 'claude-rag session update \"progress notes\"' to log progress")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Failed to start session: {e}")
+        return 1
+
+
+def session_update(session_manager: "SessionManager", args) -> int:
+    """Update current session with progress."""
+    if not session_manager.update_session(
+        notes=args.notes,
+        blocker=args.blocker,
+        decision=args.decision
+    ):
+        print("❌ No active session found")
+        print("💡 Start a session with 'claude-rag session start <name>'")
+        return 1
+
+    print(f"✅ Session updated: {args.notes}")
+
+    if args.blocker:
+        print(f"🚫 Blocker recorded: {args.blocker}")
+
+    if args.decision:
+        print(f"🎯 Decision recorded: {args.decision}")
+
+    return 0
+
+
+def session_end(session_manager: "SessionManager", args) -> int:
+    """End the current session."""
+    session = session_manager.end_session(summary=args.summary or "")
+
+    if not session:
+        print("❌ No active session found")
+        return 1
+
+    print(f"🏁 Session ended: {session.name}")
+    print(f"⏱️  Duration: {session.start_time} → {session.end_time}")
+
+    if session.lines_added or session.lines_removed:
+        print(f"📊 Code changes: +{session.lines_added} -{session.lines_removed} lines")
+
+    if args.summary:
+        print(f"📋 Summary: {args.summary}")
+
+    print(f"\n📄 Session report available: claude-rag session report {session.session_id}")
+    return 0
+
+
+def session_pause(session_manager: "SessionManager", args) -> int:
+    """Pause the current session."""
+    if not session_manager.pause_session(reason=args.reason or ""):
+        print("❌ No active session found")
+        return 1
+
+    print("⏸️  Session paused")
+    if args.reason:
+        print(f"📝 Reason: {args.reason}")
+
+    return 0
+
+
+def session_resume(session_manager: "SessionManager", args) -> int:
+    """Resume a paused session."""
+    if not session_manager.resume_session(args.session_id):
+        print(f"❌ Failed to resume session: {args.session_id}")
+        print("💡 Use 'claude-rag session list --status paused' to see paused sessions")
+        return 1
+
+    session = session_manager.get_current_session()
+    print(f"▶️  Resumed session: {session.name}")
+    print(f"📅 Session ID: {session.session_id}")
+
+    return 0
+
+
+def session_list(session_manager: "SessionManager", args) -> int:
+    """List all sessions."""
+    display_time = _load('utils.session_manager', '_display_time')
+    # Group by status in one pass, dropping other statuses if filtering
+    by_status = defaultdict(list)
+    total = 0
+    for session in session_manager.list_sessions():
+        status = session.get('status')
+        if args.status and status != args.status:
+            continue
+        by_status[status].append(session)
+        total += 1
+
+    if not total:
+        status_msg = f" with status '{args.status}'" if args.status else ""
+        print(f"📭 No sessions found{status_msg}")
+        return 0
+
+    lines = [f"📋 Sessions ({total}):", "=" * 60]
+
+    for status, icon, heading in _SESSION_STATUSES:
+        status_sessions = by_status.get(status)
+        if not status_sessions:
+            continue
+
+        lines.append(f"\n{icon} {heading} ({len(status_sessions)}):")
+
+        for session_id, name, start_time in map(_SESSION_FIELDS, status_sessions):
+            lines.append(f"  • {session_id[:8]} - {name} ({display_time(start_time)})")
+
+    print("\n".join(lines))
+    return 0
+
+
+def session_show(session_manager: "SessionManager", args) -> int:
+    """Show detailed session information."""
+    display_time = _load('utils.session_manager', '_display_time')
+    session = session_manager.get_session_details(args.session_id)
+
+    if not session:
+        print(f"❌ Session not found: {args.session_id}")
+        return 1
+
+    lines = [
+        f"📄 Session: {session.name}",
+        "=" * 60,
+        f"ID: {session.session_id}",
+        f"Status: {session.status}",
+        f"Started: {session.start_time}",
+    ]
+
+    if session.end_time:
+        lines.append(f"Ended: {session.end_time}")
+
+    if session.description:
+        lines.append(f"Description: {session.description}")
+
+    if session.objectives:
+        lines.append(f"\nObjectives:")
+        for i, obj in enumerate(session.objectives, 1):
+            lines.append(f"  {i}. {obj}")
+
+    lines.append(f"\nGit Info:")
+    lines.append(f"  Branch: {session.initial_branch}")
+    lines.append(f"  Initial: {session.initial_commit[:8]}")
+    if session.final_commit:
+        lines.append(f"  Final: {session.final_commit[:8]}")
+
+    if session.lines_added or session.lines_removed:
+        lines.append(f"  Changes: +{session.lines_added} -{session.lines_removed} lines")
+
+    if session.progress_log:
+        lines.append(f"\nProgress ({len(session.progress_log)} entries):")
+        for entry in session.progress_log[-5:]:  # Show last 5 entries
+            timestamp = display_time(entry['timestamp'])
+            lines.append(f"  • {timestamp}: {entry['notes']}")
+
+    # Render open blockers straight into their lines; the heading needs the count
+    blocker_lines = [
+        f"  🚫 {display_time(blocker['timestamp'])}: {blocker['description']}"
+        for blocker in session.blockers if blocker.get('status') == 'open'
+    ]
+    if blocker_lines:
+        lines.append(f"\nOpen Blockers ({len(blocker_lines)}):")
+        lines.extend(blocker_lines)
+
+    print("\n".join(lines))
+    return 0
+
+
+def session_current(session_manager: "SessionManager", args) -> int:
+    """Show current session status."""
+    display_time = _load('utils.session_manager', '_display_time')
+    session = session_manager.get_current_session()
+
+    if not session:
+        print("📭 No active session")
+        print("💡 Start a session with 'claude-rag session start <name>'")
+        return 0
+
+    print(f"🟢 Current Session: {session.name}")
+    print(f"📅 ID: {session.session_id}")
+    print(f"⏱️  Started: {session.start_time}")
+    print(f"🌿 Branch: {session.initial_branch}")
+
+    if session.progress_log:
+        latest = session.progress_log[-1]
+        latest_time = display_time(latest['timestamp'])
+        print(f"📝 Latest: {latest_time} - {latest['notes']}")
+
+    # Show any open blockers; only the count is needed, so don't build a list
+    open_count = sum(1 for b in session.blockers if b.get('status') == 'open')
+    if open_count:
+        print(f"🚫 Open blockers: {open_count}")
+
+    return 0
+
+
+def session_report(session_manager: "SessionManager", args) -> int:
+    """Generate a detailed session report."""
+    # Check first so a missing session never truncates --output; the lookup
+    # is cached, so streaming the report does not load it again
+    if session_manager.get_session_details(args.session_id) is None:
+        print(f"❌ Session not found: {args.session_id}")
+        return 1
+
+    if args.output:
+        try:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                session_manager.stream_session_report(args.session_id, f)
+            print(f"📄 Report saved to: {args.output}")
+        except Exception as e:
+            print(f"❌ Failed to save report: {e}")
+            return 1
+    else:
+        session_manager.stream_session_report(args.session_id, sys.stdout)
+        sys.stdout.write("\n")
+
+    return 0
@@ -3,7 +3,13 @@
 Core components of the Claude RAG Toolkit.
 """
 
-from .rag_engine import MultiRepoRAGEngine
-from .knowledge_extractor import KnowledgeExtractor
+try:
+    from utils._lazy import attach
+except ImportError:
+    from ..utils._lazy import attach
 
-__all__ = ["MultiRepoRAGEngine", "KnowledgeExtractor"]
\ No newline at end of file
+# Resolved on first access so importing core.<module> stays cheap
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "rag_engine": ["MultiRepoRAGEngine"],
+    "knowledge_extractor": ["KnowledgeExtractor"],
+})
@@ -5,9 +5,148 @@ Extracts structured knowledge from different file types and repository contexts.
 """
 
 import re
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Optional, Any
+
+try:
+    from utils._json import loads, JSONDecodeError
+except ImportError:
+    from ..utils._json import loads, JSONDecodeError
+
+
+# Markdown keyword sets, each found with a single regex scan of the
+# lowercased content rather than one substring test per keyword and line
+_MD_CONFIG_RE = re.compile(r'namespace|image|port|enabled|ip|url')
+_MD_TROUBLE_RE = re.compile(r'error|failed|issue|problem|fix|solution|resolved')
+_MD_DEPENDENCY_RE = re.compile(r'requires|depends on|prerequisite|needs')
+
+# Fenced code block languages whose lines are indexed as commands
+_SHELL_BLOCK_LANGS = frozenset({'bash', 'shell', 'sh'})
+
+# Paths to documentation, YAML, shell, Python and JSON files
+_FILE_REF_RE = re.compile(r'[a-zA-Z0-9_\-./]+\.(?:md|ya?ml|sh|py|json)')
+
+# MLOps keywords tagged with the kind of knowledge they signal; one
+# alternation finds every keyword on a line in a single pass
+_MLOPS_KEYWORDS = {
+    'apiversion:': 'kubernetes',
+    'kind:': 'kubernetes',
+    '- name:': 'ansible',
+    'harbor': 'service',
+    'mlflow': 'service',
+    'seldon': 'service',
+    'istio': 'service',
+    'prometheus': 'service',
+}
+_MLOPS_RE = re.compile('|'.join(map(re.escape, _MLOPS_KEYWORDS)))
+
+# ML model keywords, tagged the same way
+_ML_MODEL_KEYWORDS = {
+    'model.fit': 'training',
+    'fit(': 'training',
+    'train(': 'training',
+    '.train': 'training',
+    'fit_transform(': 'features',
+    'transform(': 'features',
+    'feature': 'features',
+    'score(': 'evaluation',
+    'accuracy': 'evaluation',
+    'precision': 'evaluation',
+    'recall': 'evaluation',
+    'f1': 'evaluation',
+}
+_ML_MODEL_RE = re.compile('|'.join(map(re.escape, _ML_MODEL_KEYWORDS)))
+
+# A stripped Python line is a class, function, import or assignment; one
+# anchored match picks the kind and captures its parts
+_PY_LINE_RE = re.compile(
+    r'class \s*(?P<cls>\w+)'
+    r'|def \s*(?P<fn>\w+)\s*\((?P<params>[^)]*)\)'
+    r'|(?P<imp>import |from )'
+    r'|(?P<var>\w+)\s*=\s*(?P<value>.+)'
+)
+
+
+def _scan_lines(pattern: re.Pattern, text: str) -> dict[int, list[str]]:
+    """Map line index -> matched strings, from one finditer pass over text.
+
+    Newlines are only counted between consecutive matches, so lines without
+    a hit cost nothing beyond the regex scan. pattern must not match '\n'.
+    """
+    hits = {}
+    line = pos = 0
+    for match in pattern.finditer(text):
+        start = match.start()
+        line += text.count('\n', pos, start)
+        pos = start
+        hits.setdefault(line, []).append(match.group())
+    return hits
+
+
+# Classifiers depend only on their text argument, so repeated inputs
+# (copy-pasted commands, keys shared across manifests) come from the cache
+
+@lru_cache(maxsize=4096)
+def _command_type(command: str) -> str:
+    """Classify a command by the tool it invokes."""
+    cmd_lower = command.lower()
+    if 'kubectl' in cmd_lower:
+        return 'kubernetes'
+    elif 'docker' in cmd_lower:
+        return 'docker'
+    elif 'ansible' in cmd_lower:
+        return 'ansible'
+    elif 'helm' in cmd_lower:
+        return 'helm'
+    elif 'git' in cmd_lower:
+        return 'git'
+    elif 'pip' in cmd_lower or 'python' in cmd_lower or 'jupyter' in cmd_lower:
+        return 'python'
+    else:
+        return 'shell'
+
+
+@lru_cache(maxsize=4096)
+def _configuration_type(line_lower: str) -> str:
+    """Classify a lowercased markdown configuration line."""
+    if 'namespace' in line_lower:
+        return 'namespace'
+    elif 'image' in line_lower:
+        return 'container_image'
+    elif 'port' in line_lower:
+        return 'network'
+    elif 'ip' in line_lower or 'loadbalancer' in line_lower:
+        return 'network'
+    else:
+        return 'general'
+
+
+@lru_cache(maxsize=4096)
+def _yaml_config_type(key: str) -> str:
+    """Classify a YAML configuration by its key."""
+    key_lower = key.lower()
+    if 'namespace' in key_lower:
+        return 'kubernetes_namespace'
+    elif 'image' in key_lower:
+        return 'container_image'
+    elif 'port' in key_lower:
+        return 'network_port'
+    elif 'enabled' in key_lower:
+        return 'feature_toggle'
+    else:
+        return 'yaml_config'
+
+
+@lru_cache(maxsize=4096)
+def _troubleshooting_type(line_lower: str) -> str:
+    """Classify a lowercased troubleshooting line."""
+    if 'error' in line_lower or 'failed' in line_lower:
+        return 'error'
+    elif 'fix' in line_lower or 'solution' in line_lower or 'resolved' in line_lower:
+        return 'solution'
+    else:
+        return 'issue'
 
 
 class KnowledgeExtractor:
@@ -16,13 +155,36 @@ class KnowledgeExtractor:
     Adapts extraction patterns to different project types.
     """
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: dict):
         self.config = config
         self.repo_type = config.get("repo_type", "generic")
-        self.keywords = set(kw.lower() for kw in config.get("keywords", []))
+        self.keywords = frozenset(kw.lower() for kw in config.get("keywords", []))
         self.extraction_focus = config.get("extraction_focus", [])
+        
+        # Extractors by file extension: line walkers get content split on
+        # '\n', the rest take the raw text
+        self._line_extractors = {
+            '.yml': self._extract_from_yaml,
+            '.yaml': self._extract_from_yaml,
+            '.py': self._extract_from_python,
+            '.sh': self._extract_from_shell,
+            '.bash': self._extract_from_shell,
+            '.js': self._extract_from_javascript,
+        }
+        self._text_extractors = {
+            '.md': self._extract_from_markdown,
+            '.rst': self._extract_from_markdown,
+            '.txt': self._extract_from_markdown,
+            '.ipynb': self._extract_from_notebook,
+        }
+        
+        # Repository-specific enhancement pass, resolved once per extractor
+        self._enhancer = {
+            "mlops-platform": self._enhance_mlops_knowledge,
+            "ml-model": self._enhance_ml_model_knowledge,
+        }.get(self.repo_type)
     
-    def extract_knowledge(self, content: str, filepath: str, file_extension: str) -> Dict:
+    def extract_knowledge(self, content: str, filepath: str, file_extension: str) -> dict:
         """
         Extract structured knowledge from file content based on file type and repo context.
         """
@@ -38,37 +200,49 @@ class KnowledgeExtractor:
             "variables": []
         }
         
-        lines = content.split('\n')
-        
-        # Apply file-type specific extractors
-        if file_extension in ['.md', '.rst', '.txt']:
-            self._extract_from_markdown(lines, knowledge, filepath)
-        elif file_extension in ['.yml', '.yaml']:
-            self._extract_from_yaml(lines, knowledge, filepath)
-        elif file_extension == '.py':
-            self._extract_from_python(lines, knowledge, filepath)
-        elif file_extension in ['.sh', '.bash']:
-            self._extract_from_shell(lines, knowledge, filepath)
-        elif file_extension == '.js':
-            self._extract_from_javascript(lines, knowledge, filepath)
-        elif file_extension == '.ipynb':
-            self._extract_from_notebook(content, knowledge, filepath)
+        # Apply file-type specific extractors. Lines are only split here for
+        # the line walkers; enhancers split on demand when they find a hit.
+        lines = None
+        extractor = self._line_extractors.get(file_extension)
+        if extractor is not None:
+            lines = content.split('\n')
+            extractor(lines, knowledge, filepath)
+        else:
+            extractor = self._text_extractors.get(file_extension)
+            if extractor is not None:
+                extractor(content, knowledge, filepath)
         
         # Apply repository-specific enhancements
-        if self.repo_type == "mlops-platform":
-            self._enhance_mlops_knowledge(knowledge, lines, filepath)
-        elif self.repo_type == "ml-model":
-            self._enhance_ml_model_knowledge(knowledge, lines, filepath)
+        if self._enhancer is not None:
+            self._enhancer(knowledge, content, lines, filepath)
         
         return knowledge
     
-    def _extract_from_markdown(self, lines: List[str], knowledge: Dict, filepath: str):
+    def _extract_from_markdown(self, content: str, knowledge: dict, filepath: str):
         """Extract knowledge from Markdown files."""
+        lines = content.split('\n')
+        
+        # Bind the output lists once instead of a dict lookup per hit
+        code_blocks = knowledge["code_blocks"]
+        concepts = knowledge["concepts"]
+        configurations = knowledge["configurations"]
+        troubleshooting = knowledge["troubleshooting"]
+        cross_references = knowledge["cross_references"]
+        dependencies = knowledge["dependencies"]
+        
         in_code_block = False
         code_block_lang = None
         code_block_content = []
         current_section = None
         
+        # Scan the whole file once per pattern; the loop only checks hits
+        content_lower = content.lower()
+        config_lines = _scan_lines(_MD_CONFIG_RE, content_lower)
+        trouble_lines = _scan_lines(_MD_TROUBLE_RE, content_lower)
+        dependency_lines = _scan_lines(_MD_DEPENDENCY_RE, content_lower)
+        file_refs = _scan_lines(_FILE_REF_RE, content)
+        hit_lines = config_lines.keys() | trouble_lines.keys() | dependency_lines.keys() | file_refs.keys()
+        
         for i, line in enumerate(lines):
             # Track code blocks
             if line.startswith('```'):
@@ -79,7 +253,7 @@ class KnowledgeExtractor:
                 else:
                     # Process completed code block
                     if code_block_content:
-                        knowledge["code_blocks"].append({
+                        code_blocks.append({
                             "language": code_block_lang,
                             "content": '\n'.join(code_block_content),
                             "line": i - len(code_block_content),
@@ -87,7 +261,7 @@ class KnowledgeExtractor:
                         })
                         
                         # Extract commands from code blocks
-                        if code_block_lang in ['bash', 'shell', 'sh']:
+                        if code_block_lang in _SHELL_BLOCK_LANGS:
                             self._extract_commands_from_block('\n'.join(code_block_content), knowledge, filepath, i)
                     
                     in_code_block = False
@@ -99,11 +273,12 @@ class KnowledgeExtractor:
             
             # Extract headers as concepts
             if line.startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                concept = line.strip('#').strip()
+                body = line.lstrip('#')
+                level = len(line) - len(body)
+                concept = body.rstrip('#').strip()
                 current_section = concept
                 
-                knowledge["concepts"].append({
+                concepts.append({
                     "name": concept,
                     "level": level,
                     "line": i,
@@ -111,42 +286,52 @@ class KnowledgeExtractor:
                     "section": current_section
                 })
             
+            # Plain prose: nothing below can match
+            if i not in hit_lines:
+                continue
+            
+            # Both classifiers share one lowercased copy of a keyword line
+            line_lower = line.lower() if i in config_lines or i in trouble_lines else None
+            
             # Extract configurations (key: value patterns)
-            if ':' in line and not line.strip().startswith('#'):
-                if any(keyword in line.lower() for keyword in ['namespace', 'image', 'port', 'enabled', 'ip', 'url']):
-                    knowledge["configurations"].append({
-                        "line": i,
-                        "content": line.strip(),
-                        "type": self._classify_configuration(line),
-                        "section": current_section
-                    })
+            if i in config_lines and ':' in line and not line.strip().startswith('#'):
+                configurations.append({
+                    "line": i,
+                    "content": line.strip(),
+                    "type": self._classify_configuration(line, line_lower),
+                    "section": current_section
+                })
             
             # Extract troubleshooting information
-            if any(word in line.lower() for word in ['error', 'failed', 'issue', 'problem', 'fix', 'solution', 'resolved']):
-                knowledge["troubleshooting"].append({
+            if i in trouble_lines:
+                troubleshooting.append({
                     "line": i,
                     "content": line.strip(),
-                    "type": self._classify_troubleshooting(line),
+                    "type": self._classify_troubleshooting(line, line_lower),
                     "section": current_section
                 })
             
             # Extract cross-references
-            refs = self._extract_file_references(line)
+            refs = file_refs.get(i)
             if refs:
-                for ref in refs:
-                    ref.update({"line": i, "section": current_section})
-                knowledge["cross_references"].extend(refs)
+                context = line.strip()
+                cross_references.extend(
+                    {"file": ref, "context": context, "line": i, "section": current_section}
+                    for ref in refs
+                )
             
             # Extract dependencies
-            if any(word in line.lower() for word in ['requires', 'depends on', 'prerequisite', 'needs']):
-                knowledge["dependencies"].append({
+            if i in dependency_lines:
+                dependencies.append({
                     "line": i,
                     "content": line.strip(),
                     "section": current_section
                 })
     
-    def _extract_from_yaml(self, lines: List[str], knowledge: Dict, filepath: str):
+    def _extract_from_yaml(self, lines: list[str], knowledge: dict, filepath: str):
         """Extract knowledge from YAML files."""
+        configurations = knowledge["configurations"]
+        variables = knowledge["variables"]
         current_key_path = []
         
         for i, line in enumerate(lines):
@@ -158,25 +343,21 @@ class KnowledgeExtractor:
             
             # Extract key-value configurations
             if ':' in stripped:
-                key_part = stripped.split(':')[0].strip()
-                value_part = ':'.join(stripped.split(':')[1:]).strip()
-                
-                # Determine indentation level
-                indent_level = (len(line) - len(line.lstrip())) // 2
+                key_part, _, value_part = stripped.partition(':')
+                key_part = key_part.strip()
+                value_part = value_part.strip()
                 
-                # Update current path
-                if indent_level < len(current_key_path):
-                    current_key_path = current_key_path[:indent_level]
+                # Determine indentation level (two spaces per level)
+                indent_level = (len(line) - len(line.lstrip())) >> 1
                 
-                if indent_level == len(current_key_path):
-                    current_key_path.append(key_part)
-                else:
-                    current_key_path = current_key_path[:indent_level] + [key_part]
+                # Update current path in place: drop deeper keys, then descend
+                del current_key_path[indent_level:]
+                current_key_path.append(key_part)
                 
                 full_key = '.'.join(current_key_path)
                 
                 # Store configuration
-                knowledge["configurations"].append({
+                configurations.append({
                     "line": i,
                     "key": full_key,
                     "value": value_part,
@@ -187,7 +368,7 @@ class KnowledgeExtractor:
                 
                 # Extract variables
                 if value_part and not value_part.startswith('[') and not value_part.startswith('{'):
-                    knowledge["variables"].append({
+                    variables.append({
                         "name": key_part,
                         "value": value_part,
                         "path": full_key,
@@ -195,8 +376,12 @@ class KnowledgeExtractor:
                         "type": "yaml_variable"
                     })
     
-    def _extract_from_python(self, lines: List[str], knowledge: Dict, filepath: str):
+    def _extract_from_python(self, lines: list[str], knowledge: dict, filepath: str):
         """Extract knowledge from Python files."""
+        concepts = knowledge["concepts"]
+        functions = knowledge["functions"]
+        dependencies = knowledge["dependencies"]
+        variables = knowledge["variables"]
         in_docstring = False
         docstring_quotes = None
         current_class = None
@@ -208,8 +393,9 @@ class KnowledgeExtractor:
             # Track docstrings
             if '"""' in stripped or "'''" in stripped:
                 if not in_docstring:
-                    in_docstring = True
                     docstring_quotes = '"""' if '"""' in stripped else "'''"
+                    # A docstring opened and closed on the same line is over
+                    in_docstring = stripped.count(docstring_quotes) % 2 == 1
                 elif docstring_quotes in stripped:
                     in_docstring = False
                 continue
@@ -217,58 +403,55 @@ class KnowledgeExtractor:
             if in_docstring:
                 continue
             
+            match = _PY_LINE_RE.match(stripped)
+            if match is None:
+                continue
+            
             # Extract class definitions
-            if stripped.startswith('class '):
-                match = re.match(r'class\s+(\w+)', stripped)
-                if match:
-                    current_class = match.group(1)
-                    knowledge["concepts"].append({
-                        "name": f"Class: {current_class}",
-                        "line": i,
-                        "type": "python_class",
-                        "context": self._get_context(lines, i, 1)
-                    })
+            if match.group('cls'):
+                current_class = match.group('cls')
+                concepts.append({
+                    "name": f"Class: {current_class}",
+                    "line": i,
+                    "type": "python_class",
+                    "context": self._get_context(lines, i, 1)
+                })
             
             # Extract function definitions
-            if stripped.startswith('def '):
-                match = re.match(r'def\s+(\w+)\s*\(([^)]*)\)', stripped)
-                if match:
-                    func_name, params = match.groups()
-                    current_function = func_name
-                    
-                    knowledge["functions"].append({
-                        "name": func_name,
-                        "parameters": params,
-                        "line": i,
-                        "class": current_class,
-                        "context": self._get_context(lines, i, 1)
-                    })
+            elif match.group('fn'):
+                func_name = current_function = match.group('fn')
+                functions.append({
+                    "name": func_name,
+                    "parameters": match.group('params'),
+                    "line": i,
+                    "class": current_class,
+                    "context": self._get_context(lines, i, 1)
+                })
             
             # Extract imports
-            if stripped.startswith(('import ', 'from ')):
-                knowledge["dependencies"].append({
+            elif match.group('imp'):
+                dependencies.append({
                     "line": i,
                     "content": stripped,
                     "type": "python_import"
                 })
             
-            # Extract variable assignments
-            if '=' in stripped and not stripped.startswith('#'):
-                # Simple variable assignment detection
-                match = re.match(r'(\w+)\s*=\s*(.+)', stripped)
-                if match and not stripped.startswith('def ') and not stripped.startswith('class '):
-                    var_name, var_value = match.groups()
-                    knowledge["variables"].append({
-                        "name": var_name,
-                        "value": var_value,
-                        "line": i,
-                        "function": current_function,
-                        "class": current_class,
-                        "type": "python_variable"
-                    })
+            # Extract variable assignments ("class = ..." is not one)
+            elif not stripped.startswith(('def ', 'class ')):
+                variables.append({
+                    "name": match.group('var'),
+                    "value": match.group('value'),
+                    "line": i,
+                    "function": current_function,
+                    "class": current_class,
+                    "type": "python_variable"
+                })
     
-    def _extract_from_shell(self, lines: List[str], knowledge: Dict, filepath: str):
+    def _extract_from_shell(self, lines: list[str], knowledge: dict, filepath: str):
         """Extract knowledge from shell scripts."""
+        commands = knowledge["commands"]
+        variables = knowledge["variables"]
+        
         for i, line in enumerate(lines):
             stripped = line.strip()
             
@@ -277,8 +460,8 @@ class KnowledgeExtractor:
                 continue
             
             # Extract commands
-            if not stripped.startswith('if ') and not stripped.startswith('for ') and not stripped.startswith('while '):
-                knowledge["commands"].append({
+            if not stripped.startswith(('if ', 'for ', 'while ')):
+                commands.append({
                     "command": stripped,
                     "line": i,
                     "file": filepath,
@@ -286,17 +469,19 @@ class KnowledgeExtractor:
                 })
             
             # Extract variable assignments
-            if '=' in stripped and not ' = ' in stripped:  # Shell variable, not comparison
-                parts = stripped.split('=', 1)
-                if len(parts) == 2 and parts[0].isidentifier():
-                    knowledge["variables"].append({
-                        "name": parts[0],
-                        "value": parts[1],
+            # NAME=value with an identifier name; ' = ' means a comparison
+            eq = stripped.find('=')
+            if eq > 0:
+                name = stripped[:eq]
+                if name.isidentifier() and ' = ' not in stripped:
+                    variables.append({
+                        "name": name,
+                        "value": stripped[eq + 1:],
                         "line": i,
                         "type": "shell_variable"
                     })
     
-    def _extract_from_javascript(self, lines: List[str], knowledge: Dict, filepath: str):
+    def _extract_from_javascript(self, lines: list[str], knowledge: dict, filepath: str):
         """Extract knowledge from JavaScript files."""
         for i, line in enumerate(lines):
             stripped = line.strip()
@@ -324,12 +509,14 @@ class KnowledgeExtractor:
                         "type": f"javascript_{var_type}"
                     })
     
-    def _extract_from_notebook(self, content: str, knowledge: Dict, filepath: str):
+    def _extract_from_notebook(self, content: str, knowledge: dict, filepath: str):
         """Extract knowledge from Jupyter notebooks."""
         try:
-            notebook = json.loads(content)
+            # Only the cells are consumed; the rest of the parsed tree
+            # (metadata, widget state) is released before they are processed
+            cells = loads(content).get('cells', [])
             
-            for cell_idx, cell in enumerate(notebook.get('cells', [])):
+            for cell_idx, cell in enumerate(cells):
                 cell_type = cell.get('cell_type')
                 source = cell.get('source', [])
                 
@@ -343,19 +530,24 @@ class KnowledgeExtractor:
                     self._extract_from_python(cell_content.split('\n'), knowledge, f"{filepath}:cell_{cell_idx}")
                 elif cell_type == 'markdown':
                     # Extract from markdown cells
-                    self._extract_from_markdown(cell_content.split('\n'), knowledge, f"{filepath}:cell_{cell_idx}")
+                    self._extract_from_markdown(cell_content, knowledge, f"{filepath}:cell_{cell_idx}")
         
-        except (json.JSONDecodeError, KeyError):
+        except (JSONDecodeError, KeyError):
             # If notebook parsing fails, treat as text
-            self._extract_from_markdown(content.split('\n'), knowledge, filepath)
+            self._extract_from_markdown(content, knowledge, filepath)
     
-    def _enhance_mlops_knowledge(self, knowledge: Dict, lines: List[str], filepath: str):
+    def _enhance_mlops_knowledge(self, knowledge: dict, content: str, lines: Optional[list[str]], filepath: str):
         """Add MLOps-specific knowledge extraction."""
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
+        hits = _scan_lines(_MLOPS_RE, content.lower())
+        if hits and lines is None:
+            lines = content.split('\n')
+        
+        for i, keywords in hits.items():
+            line = lines[i]
+            found = {_MLOPS_KEYWORDS[keyword] for keyword in keywords}
             
             # Kubernetes resources
-            if 'apiversion:' in line_lower or 'kind:' in line_lower:
+            if 'kubernetes' in found:
                 knowledge["configurations"].append({
                     "line": i,
                     "content": line.strip(),
@@ -364,7 +556,7 @@ class KnowledgeExtractor:
                 })
             
             # Ansible tasks
-            if '- name:' in line_lower:
+            if 'ansible' in found:
                 knowledge["concepts"].append({
                     "name": f"Ansible Task: {line.split(':', 1)[1].strip()}",
                     "line": i,
@@ -373,7 +565,7 @@ class KnowledgeExtractor:
                 })
             
             # Service definitions
-            if any(service in line_lower for service in ['harbor', 'mlflow', 'seldon', 'istio', 'prometheus']):
+            if 'service' in found:
                 if ':' in line and not line.strip().startswith('#'):
                     knowledge["configurations"].append({
                         "line": i,
@@ -382,13 +574,18 @@ class KnowledgeExtractor:
                         "category": "mlops"
                     })
     
-    def _enhance_ml_model_knowledge(self, knowledge: Dict, lines: List[str], filepath: str):
+    def _enhance_ml_model_knowledge(self, knowledge: dict, content: str, lines: Optional[list[str]], filepath: str):
         """Add ML model-specific knowledge extraction."""
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
+        hits = _scan_lines(_ML_MODEL_RE, content.lower())
+        if hits and lines is None:
+            lines = content.split('\n')
+        
+        for i, keywords in hits.items():
+            line = lines[i]
+            found = {_ML_MODEL_KEYWORDS[keyword] for keyword in keywords}
             
             # Model training patterns
-            if any(pattern in line_lower for pattern in ['fit(', 'train(', 'model.fit', '.train']):
+            if 'training' in found:
                 knowledge["concepts"].append({
                     "name": "Model Training",
                     "line": i,
@@ -398,7 +595,7 @@ class KnowledgeExtractor:
                 })
             
             # Feature engineering
-            if any(pattern in line_lower for pattern in ['transform(', 'fit_transform(', 'feature']):
+            if 'features' in found:
                 knowledge["concepts"].append({
                     "name": "Feature Engineering",
                     "line": i,
@@ -408,7 +605,7 @@ class KnowledgeExtractor:
                 })
             
             # Model evaluation
-            if any(pattern in line_lower for pattern in ['score(', 'accuracy', 'precision', 'recall', 'f1']):
+            if 'evaluation' in found:
                 knowledge["concepts"].append({
                     "name": "Model Evaluation",
                     "line": i,
@@ -417,7 +614,7 @@ class KnowledgeExtractor:
                     "category": "ml_model"
                 })
     
-    def _extract_commands_from_block(self, content: str, knowledge: Dict, filepath: str, line_offset: int):
+    def _extract_commands_from_block(self, content: str, knowledge: dict, filepath: str, line_offset: int):
         """Extract commands from code blocks."""
         for i, line in enumerate(content.split('\n')):
             stripped = line.strip()
@@ -432,86 +629,34 @@ class KnowledgeExtractor:
     
     def _classify_command(self, command: str) -> str:
         """Classify command type."""
-        cmd_lower = command.lower()
-        if 'kubectl' in cmd_lower:
-            return 'kubernetes'
-        elif 'docker' in cmd_lower:
-            return 'docker'
-        elif 'ansible' in cmd_lower:
-            return 'ansible'
-        elif 'helm' in cmd_lower:
-            return 'helm'
-        elif 'git' in cmd_lower:
-            return 'git'
-        elif any(tool in cmd_lower for tool in ['pip', 'python', 'jupyter']):
-            return 'python'
-        else:
-            return 'shell'
+        return _command_type(command)
     
-    def _classify_configuration(self, line: str) -> str:
+    def _classify_configuration(self, line: str, line_lower: Optional[str] = None) -> str:
         """Classify configuration type."""
-        line_lower = line.lower()
-        if 'namespace' in line_lower:
-            return 'namespace'
-        elif 'image' in line_lower:
-            return 'container_image'
-        elif 'port' in line_lower:
-            return 'network'
-        elif 'ip' in line_lower or 'loadbalancer' in line_lower:
-            return 'network'
-        else:
-            return 'general'
+        return _configuration_type(line.lower() if line_lower is None else line_lower)
     
     def _classify_yaml_config(self, key: str, value: str) -> str:
         """Classify YAML configuration type."""
-        key_lower = key.lower()
-        if 'namespace' in key_lower:
-            return 'kubernetes_namespace'
-        elif 'image' in key_lower:
-            return 'container_image'
-        elif 'port' in key_lower:
-            return 'network_port'
-        elif 'enabled' in key_lower:
-            return 'feature_toggle'
-        else:
-            return 'yaml_config'
+        return _yaml_config_type(key)
     
-    def _classify_troubleshooting(self, line: str) -> str:
+    def _classify_troubleshooting(self, line: str, line_lower: Optional[str] = None) -> str:
         """Classify troubleshooting entry type."""
-        line_lower = line.lower()
-        if 'error' in line_lower or 'failed' in line_lower:
-            return 'error'
-        elif 'fix' in line_lower or 'solution' in line_lower or 'resolved' in line_lower:
-            return 'solution'
-        else:
-            return 'issue'
+        return _troubleshooting_type(line.lower() if line_lower is None else line_lower)
     
     def _classify_shell_command(self, command: str) -> str:
         """Classify shell command type."""
-        return self._classify_command(command)
+        return _command_type(command)
     
-    def _extract_file_references(self, line: str) -> List[Dict]:
+    def _extract_file_references(self, line: str) -> list[dict]:
         """Extract file references from text."""
-        refs = []
-        patterns = [
-            r'([a-zA-Z0-9_\-./]+\.md)',
-            r'([a-zA-Z0-9_\-./]+\.ya?ml)',
-            r'([a-zA-Z0-9_\-./]+\.sh)',
-            r'([a-zA-Z0-9_\-./]+\.py)',
-            r'([a-zA-Z0-9_\-./]+\.json)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, line)
-            for match in matches:
-                refs.append({
-                    "file": match,
-                    "context": line.strip()
-                })
+        matches = _FILE_REF_RE.findall(line)
+        if not matches:
+            return []
         
-        return refs
+        context = line.strip()
+        return [{"file": match, "context": context} for match in matches]
     
-    def _get_context(self, lines: List[str], index: int, window: int = 2) -> str:
+    def _get_context(self, lines: list[str], index: int, window: int = 2) -> str:
         """Get context around a line."""
         start = max(0, index - window)
         end = min(len(lines), index + window + 1)
@@ -5,22 +5,194 @@ Core engine that adapts to different project types and provides intelligent sear
 """
 
 import os
-import json
+import fnmatch
 import hashlib
+import multiprocessing
+import heapq
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Optional, Any
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 import subprocess
 
 # Handle both relative and absolute imports
 try:
     from utils.repo_detector import RepositoryDetector
     from utils.embedding_provider import EmbeddingProvider
+    from utils._json import dumps, loads, JSONDecodeError
 except ImportError:
     from ..utils.repo_detector import RepositoryDetector
     from ..utils.embedding_provider import EmbeddingProvider
+    from ..utils._json import dumps, loads, JSONDecodeError
+
+
+# MLOps patterns, each run once over a whole file. None may match across a
+# newline, so every match belongs to a single line.
+_ANSIBLE_TASK_RE = re.compile(r'^[^\S\n]*- name:(.*)', re.MULTILINE)
+_K8S_RESOURCE_RE = re.compile(r'^[^\S\n]*(?:apiVersion|kind):', re.MULTILINE)
+_JINJA_VAR_RE = re.compile(r'{{[^\S\n]*([^}\n]+)[^\S\n]*}}')
+# Matched against lowercased text
+_STORAGE_RE = re.compile(r'pvc|storage:|storageclass|volumeclaim|persistent')
+_STORAGE_KEYWORDS = ('persistentvolumeclaim', 'pvc', 'storage', 'storageclass', 'volumeclaim', 'persistent')
+_REGISTRY_RE = re.compile(r'harbor|registry')
+_SERVICE_ENDPOINT_RE = re.compile(r'loadbalancer_ip|nodeport')
+
+# Common patterns: troubleshooting words (lowercased text) and the hints
+# that a line may reference another file
+_TROUBLE_RE = re.compile(r'error|failed|issue|problem|fix|solution')
+_REF_HINT_RE = re.compile(r'\.md|\.yml')
+_SEE_RE = re.compile(r'see')
+
+# MLOps/Infrastructure synonyms used to expand search queries
+_SYNONYMS = {
+    'persistence': ['persistent', 'pvc', 'persistentvolumeclaim', 'storage', 'volume'],
+    'storage': ['persistent', 'pvc', 'persistentvolumeclaim', 'persistence', 'volume'],
+    'harbor': ['registry', 'docker_registry', 'container_registry', 'image_registry'],
+    'registry': ['harbor', 'docker_registry', 'container_registry'],
+    'loadbalancer': ['lb', 'load_balancer', 'metallb', 'service'],
+    'kubernetes': ['k8s', 'kubectl', 'kube'],
+    'ansible': ['playbook', 'role', 'task'],
+    'monitoring': ['prometheus', 'grafana', 'metrics', 'observability'],
+    'security': ['tls', 'ssl', 'certificate', 'cert', 'secret'],
+    'deployment': ['deploy', 'rollout', 'install', 'setup']
+}
+
+
+def _synonym_expansions(synonyms: dict) -> dict[str, frozenset]:
+    """Map each term to everything a query for it expands to.
+    
+    A key expands to its synonyms; a term listed as a synonym also expands
+    to that key and the key's other synonyms.
+    """
+    expansions = defaultdict(set)
+    for key, values in synonyms.items():
+        expansions[key].update(values)
+        for value in values:
+            expansions[value].add(key)
+            expansions[value].update(values)
+    return {term: frozenset(terms) for term, terms in expansions.items()}
+
+
+_SYNONYM_EXPANSIONS = _synonym_expansions(_SYNONYMS)
+
+# (knowledge bucket, field) pairs whose text feeds semantic search, in order:
+# concepts, commands, configurations, troubleshooting, MLOps and ML model entries
+_SEARCHABLE_FIELDS = (
+    ("concepts", "name"),
+    ("commands", "command"),
+    ("configurations", "content"),
+    ("troubleshooting", "content"),
+    ("ansible_tasks", "name"),
+    ("storage_configs", "content"),
+    ("harbor_configs", "content"),
+    ("functions", "name"),
+)
+
+# File reference patterns, each keyed by a substring that any match contains.
+# They stay separate scans: one alternation would change which of several
+# overlapping references (e.g. "notes.md.sh") gets reported.
+_REF_PATTERNS = (
+    ('.md', re.compile(r'([a-zA-Z0-9_\-/.]+\.md)')),
+    ('.y', re.compile(r'([a-zA-Z0-9_\-/.]+\.ya?ml)')),
+    ('.sh', re.compile(r'([a-zA-Z0-9_\-/.]+\.sh)')),
+    ('.py', re.compile(r'([a-zA-Z0-9_\-/.]+\.py)')),
+)
+
+
+def _line_matches(pattern: re.Pattern, text: str):
+    """Yield (line index, match) for each match of pattern in text.
+    
+    Newlines are counted only between consecutive matches, so the scan stays
+    in C for lines without a hit.
+    """
+    line = pos = 0
+    for match in pattern.finditer(text):
+        start = match.start()
+        line += text.count('\n', pos, start)
+        pos = start
+        yield line, match
+
+
+# Below this many changed files, a process pool costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+# Changed documents embedded per model call during indexing
+_EMBEDDING_BATCH_SIZE = 64
+
+# Per-process engine used by index workers; see _init_index_worker
+_worker_engine = None
+
+
+def _init_index_worker(config: dict):
+    """Set up a pool process for extraction.
+    
+    Extraction only reads self.config, so the worker engine skips repository
+    detection, index loading and embedding setup.
+    """
+    global _worker_engine
+    _worker_engine = MultiRepoRAGEngine.__new__(MultiRepoRAGEngine)
+    _worker_engine.config = config
+
+
+def _try_read_and_extract(engine, filepath: Path, relative_path: str):
+    """Return (content, knowledge) for a file, or the exception raised."""
+    try:
+        return engine._read_and_extract(filepath, relative_path)
+    except Exception as e:
+        return e
+
+
+def _index_worker(item: tuple) -> Any:
+    """Pool entry point: extract one (filepath, relative_path) item."""
+    return _try_read_and_extract(_worker_engine, *item)
+
+
+def _read_text(filepath: Path) -> str:
+    """Read a file as UTF-8, dropping undecodable bytes.
+    
+    Same result as read_text(errors='ignore') with universal newlines, but
+    decodes in one call instead of through a text-mode file wrapper.
+    """
+    content = filepath.read_bytes().decode('utf-8', errors='ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _walk_files(root: Path, exclude: list[str]):
+    """Yield the Path of every file under root, in one pass.
+    
+    Directories whose relative path contains an exclude substring are not
+    entered: every file below them would contain it too. Symlinked
+    directories are not followed, as with Path.rglob.
+    """
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                relative_path = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not any(ex in relative_path for ex in exclude):
+                        stack.append((entry.path, relative_path + os.sep))
+                elif entry.is_file():
+                    yield Path(entry.path)
+
+
+def _hit_lines(pattern: re.Pattern, text: str):
+    """Yield the index of each line of text that pattern matches, once."""
+    last = -1
+    for line, _ in _line_matches(pattern, text):
+        if line != last:
+            last = line
+            yield line
 
 
 class MultiRepoRAGEngine:
@@ -29,6 +201,10 @@ class MultiRepoRAGEngine:
     Provides project-aware indexing and intelligent search capabilities.
     """
     
+    # Top-level index fields used by summaries (stats, recent changes)
+    META_KEYS = ("version", "repo_type", "created", "last_updated", "last_indexed",
+                 "project_stats", "statistics", "recent_changes")
+    
     def __init__(self, project_root: str = ".", config_file: str = None):
         self.project_root = Path(project_root).resolve()
         self.rag_dir = self.project_root / ".claude-rag"
@@ -48,12 +224,14 @@ class MultiRepoRAGEngine:
         
         # Track if semantic search is enabled
         self.semantic_search_enabled = self.config.get("semantic_search", {}).get("enabled", True)
+        
+        # doc_path -> (file hash, searchable text), filled on first semantic search
+        self._searchable_texts = {}
     
-    def _load_or_create_config(self) -> Dict:
+    def _load_or_create_config(self) -> dict:
         """Load existing config or create new one with auto-detection."""
         if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            return loads(Path(self.config_file).read_bytes())
         
         # Auto-detect repository type and create config
         print("🔍 Auto-detecting repository type...")
@@ -64,8 +242,7 @@ class MultiRepoRAGEngine:
         
         # Save config
         self.rag_dir.mkdir(exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        Path(self.config_file).write_bytes(dumps(config, indent=True))
         
         # Create .gitignore for generated files
         gitignore_path = self.rag_dir / ".gitignore"
@@ -74,13 +251,12 @@ class MultiRepoRAGEngine:
         
         return config
     
-    def _load_or_create_index(self) -> Dict:
+    def _load_or_create_index(self) -> dict:
         """Load existing index or create new one."""
         if self.index_file.exists():
             try:
-                with open(self.index_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
+                return loads(self.index_file.read_bytes())
+            except (JSONDecodeError, FileNotFoundError):
                 pass
         
         return {
@@ -96,10 +272,30 @@ class MultiRepoRAGEngine:
             "project_stats": {}
         }
     
+    @classmethod
+    def load_meta_only(cls, index_file) -> dict:
+        """Read just the META_KEYS fields of an index file.
+        
+        Skips config loading, repository detection and embedding setup, and
+        drops the per-document payload as soon as it is parsed. Raises
+        FileNotFoundError or JSONDecodeError like a plain load.
+        """
+        index = loads(Path(index_file).read_bytes())
+        return {key: index[key] for key in cls.META_KEYS if key in index}
+    
     def compute_file_hash(self, filepath: Path) -> str:
-        """Compute hash for change detection."""
+        """Compute hash for change detection.
+        
+        BLAKE2b cut to 16 bytes: faster than MD5 without hardware support and
+        the same 32-char hex length, so existing MD5 entries simply fail to
+        match and get reindexed once.
+        """
         try:
-            return hashlib.md5(filepath.read_bytes()).hexdigest()
+            digest = hashlib.blake2b(digest_size=16)
+            with open(filepath, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            return digest.hexdigest()
         except:
             return "error"
     
@@ -120,7 +316,6 @@ class MultiRepoRAGEngine:
                     return True
             # Complex pattern like roles/**/*.yml or inventory/**/*.yml
             elif '**' in pattern:
-                import fnmatch
                 if fnmatch.fnmatch(relative_path, pattern):
                     return True
             # Exact match
@@ -133,7 +328,7 @@ class MultiRepoRAGEngine:
         
         return False
     
-    def extract_knowledge(self, content: str, filepath: str) -> Dict:
+    def extract_knowledge(self, content: str, filepath: str) -> dict:
         """Extract knowledge adapted to repository type."""
         knowledge = {
             "concepts": [],
@@ -151,19 +346,25 @@ class MultiRepoRAGEngine:
         
         # Repository-specific extraction
         if repo_type == "mlops-platform":
-            knowledge.update(self._extract_mlops_knowledge(lines, filepath))
+            knowledge.update(self._extract_mlops_knowledge(content, lines, filepath))
         elif repo_type == "ml-model":
             knowledge.update(self._extract_ml_model_knowledge(lines, filepath))
         elif repo_type == "web-app":
             knowledge.update(self._extract_webapp_knowledge(lines, filepath))
         
         # Common extraction patterns
-        knowledge.update(self._extract_common_knowledge(lines, filepath))
+        knowledge.update(self._extract_common_knowledge(content, lines, filepath))
         
         return knowledge
     
-    def _extract_mlops_knowledge(self, lines: List[str], filepath: str) -> Dict:
-        """Extract MLOps-specific knowledge patterns."""
+    def _extract_mlops_knowledge(self, content: str, lines: list[str], filepath: str) -> dict:
+        """Extract MLOps-specific knowledge patterns.
+        
+        Each pattern is a single regex scan of the file; only matching lines
+        are visited. Line-anchored patterns are skipped outright when their
+        literal token is absent, which a substring search finds much faster
+        than a regex tried at every line start.
+        """
         knowledge = {
             "ansible_tasks": [],
             "kubernetes_resources": [],
@@ -173,76 +374,73 @@ class MultiRepoRAGEngine:
             "harbor_configs": [],
             "variables": []
         }
+        content_lower = content.lower()
+        
+        # Ansible task detection
+        ansible_matches = _line_matches(_ANSIBLE_TASK_RE, content) if '- name:' in content else ()
+        for i, match in ansible_matches:
+            knowledge["ansible_tasks"].append({
+                "name": match.group(1).strip(),
+                "line": i,
+                "file": filepath,
+                "type": "ansible_task"
+            })
         
-        in_task = False
-        current_task = None
+        # Kubernetes resource detection
+        if 'apiVersion:' in content or 'kind:' in content:
+            k8s_lines = _hit_lines(_K8S_RESOURCE_RE, content)
+        else:
+            k8s_lines = ()
+        for i in k8s_lines:
+            knowledge["kubernetes_resources"].append({
+                "line": i,
+                "content": lines[i].strip(),
+                "file": filepath,
+                "type": "k8s_resource"
+            })
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            
-            # Ansible task detection
-            if line.strip().startswith("- name:"):
-                task_name = line.split("- name:", 1)[1].strip()
-                knowledge["ansible_tasks"].append({
-                    "name": task_name,
-                    "line": i,
-                    "file": filepath,
-                    "type": "ansible_task"
-                })
-            
-            # Kubernetes resource detection
-            if line.strip().startswith("apiVersion:") or line.strip().startswith("kind:"):
-                knowledge["kubernetes_resources"].append({
-                    "line": i,
-                    "content": line.strip(),
-                    "file": filepath,
-                    "type": "k8s_resource"
-                })
-            
-            # Storage and persistence detection
-            if any(keyword in line_lower for keyword in ['persistentvolumeclaim', 'pvc', 'storage:', 'storageclass', 'volumeclaim', 'persistent']):
-                knowledge["storage_configs"].append({
-                    "line": i,
-                    "content": line.strip(),
-                    "file": filepath,
-                    "type": "storage_config",
-                    "keywords": [kw for kw in ['persistentvolumeclaim', 'pvc', 'storage', 'storageclass', 'volumeclaim', 'persistent'] if kw in line_lower]
-                })
-            
-            # Harbor-specific configurations
-            if any(keyword in line_lower for keyword in ['harbor', 'registry', 'docker_registry', 'container_registry']):
-                knowledge["harbor_configs"].append({
-                    "line": i,
-                    "content": line.strip(),
-                    "file": filepath,
-                    "type": "harbor_config"
-                })
-            
-            # Ansible variables detection (including Jinja2 templates)
-            if '{{' in line and '}}' in line:
-                import re
-                variables = re.findall(r'{{\s*([^}]+)\s*}}', line)
-                for var in variables:
-                    knowledge["variables"].append({
-                        "variable": var.strip(),
-                        "line": i,
-                        "file": filepath,
-                        "context": line.strip(),
-                        "type": "jinja2_variable"
-                    })
-            
-            # Service endpoint detection
-            if "loadbalancer_ip" in line_lower or "nodeport" in line_lower:
-                knowledge["service_endpoints"].append({
-                    "line": i,
-                    "content": line.strip(),
-                    "file": filepath,
-                    "type": "service_endpoint"
-                })
+        # Storage and persistence detection
+        for i in _hit_lines(_STORAGE_RE, content_lower):
+            line_lower = lines[i].lower()
+            knowledge["storage_configs"].append({
+                "line": i,
+                "content": lines[i].strip(),
+                "file": filepath,
+                "type": "storage_config",
+                "keywords": [kw for kw in _STORAGE_KEYWORDS if kw in line_lower]
+            })
+        
+        # Harbor-specific configurations
+        for i in _hit_lines(_REGISTRY_RE, content_lower):
+            knowledge["harbor_configs"].append({
+                "line": i,
+                "content": lines[i].strip(),
+                "file": filepath,
+                "type": "harbor_config"
+            })
+        
+        # Ansible variables detection (including Jinja2 templates)
+        for i, match in _line_matches(_JINJA_VAR_RE, content):
+            knowledge["variables"].append({
+                "variable": match.group(1).strip(),
+                "line": i,
+                "file": filepath,
+                "context": lines[i].strip(),
+                "type": "jinja2_variable"
+            })
+        
+        # Service endpoint detection
+        for i in _hit_lines(_SERVICE_ENDPOINT_RE, content_lower):
+            knowledge["service_endpoints"].append({
+                "line": i,
+                "content": lines[i].strip(),
+                "file": filepath,
+                "type": "service_endpoint"
+            })
         
         return knowledge
     
-    def _extract_ml_model_knowledge(self, lines: List[str], filepath: str) -> Dict:
+    def _extract_ml_model_knowledge(self, lines: list[str], filepath: str) -> dict:
         """Extract ML model-specific knowledge patterns."""
         knowledge = {
             "model_configs": [],
@@ -280,7 +478,7 @@ class MultiRepoRAGEngine:
         
         return knowledge
     
-    def _extract_webapp_knowledge(self, lines: List[str], filepath: str) -> Dict:
+    def _extract_webapp_knowledge(self, lines: list[str], filepath: str) -> dict:
         """Extract web application-specific knowledge patterns."""
         knowledge = {
             "components": [],
@@ -307,7 +505,7 @@ class MultiRepoRAGEngine:
         
         return knowledge
     
-    def _extract_common_knowledge(self, lines: List[str], filepath: str) -> Dict:
+    def _extract_common_knowledge(self, content: str, lines: list[str], filepath: str) -> dict:
         """Extract common patterns across all repository types."""
         knowledge = {
             "concepts": [],
@@ -316,6 +514,13 @@ class MultiRepoRAGEngine:
             "cross_references": []
         }
         
+        # Keyword lines come from whole-file scans; the loop below only
+        # tracks code blocks and headers line by line
+        content_lower = content.lower()
+        trouble_lines = set(_hit_lines(_TROUBLE_RE, content_lower))
+        ref_lines = set(_hit_lines(_REF_HINT_RE, content))
+        ref_lines.update(_hit_lines(_SEE_RE, content_lower))
+        
         in_code_block = False
         code_block_lang = None
         
@@ -352,7 +557,7 @@ class MultiRepoRAGEngine:
                 })
             
             # Troubleshooting detection
-            if any(word in line.lower() for word in ['error', 'failed', 'issue', 'problem', 'fix', 'solution']):
+            if i in trouble_lines:
                 knowledge["troubleshooting"].append({
                     "line": i,
                     "content": line.strip(),
@@ -361,7 +566,7 @@ class MultiRepoRAGEngine:
                 })
             
             # Cross-reference detection
-            if '.md' in line or '.yml' in line or 'see' in line.lower():
+            if i in ref_lines:
                 refs = self._extract_references(line, filepath)
                 knowledge["cross_references"].extend(refs)
         
@@ -393,97 +598,60 @@ class MultiRepoRAGEngine:
         else:
             return 'issue'
     
-    def _extract_references(self, line: str, current_file: str) -> List[Dict]:
+    def _extract_references(self, line: str, current_file: str) -> list[dict]:
         """Extract file references from line."""
         refs = []
-        patterns = [
-            r'([a-zA-Z0-9_\-/.]+\.md)',
-            r'([a-zA-Z0-9_\-/.]+\.ya?ml)',
-            r'([a-zA-Z0-9_\-/.]+\.sh)',
-            r'([a-zA-Z0-9_\-/.]+\.py)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, line)
-            for match in matches:
+        context = None
+        for marker, pattern in _REF_PATTERNS:
+            # A pattern cannot match without its extension in the line
+            if marker not in line:
+                continue
+            for match in pattern.findall(line):
+                if context is None:
+                    context = line.strip()
                 refs.append({
                     "target_file": match,
                     "source_file": current_file,
-                    "context": line.strip(),
+                    "context": context,
                     "type": "file_reference"
                 })
         
         return refs
     
-    def _expand_search_terms(self, query: str) -> List[str]:
+    def _expand_search_terms(self, query: str) -> list[str]:
         """Expand search terms with synonyms for better matching."""
-        # MLOps/Infrastructure synonyms
-        synonyms = {
-            'persistence': ['persistent', 'pvc', 'persistentvolumeclaim', 'storage', 'volume'],
-            'storage': ['persistent', 'pvc', 'persistentvolumeclaim', 'persistence', 'volume'],
-            'harbor': ['registry', 'docker_registry', 'container_registry', 'image_registry'],
-            'registry': ['harbor', 'docker_registry', 'container_registry'],
-            'loadbalancer': ['lb', 'load_balancer', 'metallb', 'service'],
-            'kubernetes': ['k8s', 'kubectl', 'kube'],
-            'ansible': ['playbook', 'role', 'task'],
-            'monitoring': ['prometheus', 'grafana', 'metrics', 'observability'],
-            'security': ['tls', 'ssl', 'certificate', 'cert', 'secret'],
-            'deployment': ['deploy', 'rollout', 'install', 'setup']
-        }
-        
         query_terms = query.lower().split()
         expanded_terms = set(query_terms)
         
         for term in query_terms:
-            if term in synonyms:
-                expanded_terms.update(synonyms[term])
-            # Also check if term is a synonym of something
-            for key, values in synonyms.items():
-                if term in values:
-                    expanded_terms.add(key)
-                    expanded_terms.update(values)
+            expanded_terms.update(_SYNONYM_EXPANSIONS.get(term, ()))
         
         return list(expanded_terms)
     
-    def _create_searchable_text(self, knowledge: Dict) -> str:
+    def _iter_searchable_parts(self, knowledge: dict):
+        """Yield the non-blank knowledge strings used for semantic search."""
+        for bucket, field in _SEARCHABLE_FIELDS:
+            for entry in knowledge.get(bucket, ()):
+                part = entry.get(field, "")
+                if part.strip():
+                    yield part
+    
+    def _create_searchable_text(self, knowledge: dict) -> str:
         """Create searchable text from extracted knowledge for semantic search."""
-        text_parts = []
-        
-        # Add concepts
-        for concept in knowledge.get("concepts", []):
-            text_parts.append(concept.get("name", ""))
-        
-        # Add command text
-        for cmd in knowledge.get("commands", []):
-            text_parts.append(cmd.get("command", ""))
-        
-        # Add configuration content
-        for config in knowledge.get("configurations", []):
-            text_parts.append(config.get("content", ""))
-        
-        # Add troubleshooting content
-        for trouble in knowledge.get("troubleshooting", []):
-            text_parts.append(trouble.get("content", ""))
-        
-        # Add MLOps-specific content
-        for task in knowledge.get("ansible_tasks", []):
-            text_parts.append(task.get("name", ""))
-        
-        for storage in knowledge.get("storage_configs", []):
-            text_parts.append(storage.get("content", ""))
-        
-        for harbor in knowledge.get("harbor_configs", []):
-            text_parts.append(harbor.get("content", ""))
-        
-        # Add ML model-specific content
-        for func in knowledge.get("functions", []):
-            text_parts.append(func.get("name", ""))
-        
-        # Filter out empty strings and join
-        filtered_parts = [part for part in text_parts if part.strip()]
-        return " ".join(filtered_parts)
+        return " ".join(self._iter_searchable_parts(knowledge))
+    
+    def _searchable_text(self, doc_path: str, doc_info: dict) -> str:
+        """Searchable text for an indexed document, rebuilt only when its hash changes."""
+        doc_hash = doc_info.get("hash")
+        cached = self._searchable_texts.get(doc_path)
+        if doc_hash is not None and cached is not None and cached[0] == doc_hash:
+            return cached[1]
+        
+        text = self._create_searchable_text(doc_info.get("knowledge", {}))
+        self._searchable_texts[doc_path] = (doc_hash, text)
+        return text
     
-    def _extract_pdf_knowledge(self, filepath: Path, relative_path: str) -> Dict:
+    def _extract_pdf_knowledge(self, filepath: Path, relative_path: str) -> dict:
         """Extract knowledge from PDF files using text extraction."""
         knowledge = {
             "concepts": [],
@@ -497,15 +665,18 @@ class MultiRepoRAGEngine:
         }
         
         try:
-            pdf_text = ""
+            # Page texts are collected and joined once; += would recopy the
+            # growing text on every page
+            page_texts = []
             
             # Try pdfplumber first (better for complex layouts)
             try:
                 import pdfplumber
                 with pdfplumber.open(filepath) as pdf:
                     for page in pdf.pages:
-                        if page.extract_text():
-                            pdf_text += page.extract_text() + "\n"
+                        page_text = page.extract_text()
+                        if page_text:
+                            page_texts.append(page_text)
                 print(f"  📑 Extracted text using pdfplumber")
                 
             except ImportError:
@@ -515,7 +686,7 @@ class MultiRepoRAGEngine:
                     with open(filepath, 'rb') as file:
                         reader = PyPDF2.PdfReader(file)
                         for page in reader.pages:
-                            pdf_text += page.extract_text() + "\n"
+                            page_texts.append(page.extract_text())
                     print(f"  📑 Extracted text using PyPDF2")
                     
                 except ImportError:
@@ -533,10 +704,11 @@ class MultiRepoRAGEngine:
                     })
                     return knowledge
             
+            pdf_text = "\n".join(page_texts) + "\n" if page_texts else ""
+            
             # If we extracted text, process it like any other document
             if pdf_text.strip():
                 # Parse the extracted text as if it were a regular text document
-                lines = pdf_text.split('\n')
                 text_knowledge = self.extract_knowledge(pdf_text, relative_path)
                 
                 # Merge the extracted knowledge
@@ -574,32 +746,40 @@ class MultiRepoRAGEngine:
         
         return knowledge
     
-    def index_project(self, force_reindex: bool = False, verbose: bool = False) -> Dict:
+    def index_project(self, force_reindex: bool = False, verbose: bool = False) -> dict:
         """Index the entire project with repository-specific optimizations."""
         print(f"🔍 Indexing {self.config.get('repo_type', 'unknown')} repository...")
         
         # Find files to index - handle both simple and complex patterns
-        files_to_index = []
+        files_to_index = set()
+        name_patterns = []
         for pattern in self.config.get("file_patterns", ["*.md"]):
             # Simple pattern like *.yml or *.md
             if '*' in pattern and '/' not in pattern:
-                files_to_index.extend(self.project_root.rglob(pattern))
-            # Complex pattern with directory structure like roles/**/*.yml
+                name_patterns.append(pattern)
+            # Complex pattern with directory structure like roles/**/*.yml:
+            # match the file name here, the full pattern in should_index_file
             elif '**' in pattern:
-                # Extract the base pattern for rglob
-                # roles/**/*.yml -> *.yml for rglob, then filter with full pattern
-                base_pattern = pattern.split('/')[-1] if '/' in pattern else pattern
-                for f in self.project_root.rglob(base_pattern):
-                    if self.should_index_file(f):
-                        files_to_index.append(f)
+                name_patterns.append(pattern.split('/')[-1])
             # Specific file pattern
             else:
                 specific_file = self.project_root / pattern
                 if specific_file.exists():
-                    files_to_index.append(specific_file)
-        
-        # Remove duplicates and filter by exclusions
-        files_to_index = list(set(files_to_index))
+                    files_to_index.add(specific_file)
+        
+        # One walk of the tree serves every glob pattern
+        if name_patterns:
+            name_matchers = [
+                re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+                for pattern in set(name_patterns)
+            ]
+            exclude = self.config.get("exclude_paths", [])
+            for filepath in _walk_files(self.project_root, exclude):
+                name = os.path.normcase(filepath.name)
+                if any(match(name) for match in name_matchers):
+                    files_to_index.add(filepath)
+        
+        # Filter by exclusions and the full patterns
         files_to_index = [
             f for f in files_to_index 
             if self.should_index_file(f)
@@ -607,11 +787,11 @@ class MultiRepoRAGEngine:
         
         print(f"📚 Found {len(files_to_index)} files to index")
         
-        indexed_count = 0
+        # Hash first, so unchanged files are never read or extracted
+        pending = []
         for filepath in files_to_index:
             try:
                 relative_path = str(filepath.relative_to(self.project_root))
-                content = filepath.read_text(encoding='utf-8', errors='ignore')
                 file_hash = self.compute_file_hash(filepath)
                 
                 # Skip if already indexed and unchanged
@@ -619,34 +799,44 @@ class MultiRepoRAGEngine:
                     if self.index["documents"][relative_path].get("hash") == file_hash:
                         continue
                 
-                print(f"  📄 {relative_path}")
-                
-                # Handle PDF files differently
-                if filepath.suffix.lower() == '.pdf':
-                    knowledge = self._extract_pdf_knowledge(filepath, relative_path)
-                else:
-                    knowledge = self.extract_knowledge(content, relative_path)
-                
-                # Store in index
-                self.index["documents"][relative_path] = {
-                    "hash": file_hash,
-                    "size": len(content),
-                    "lines": content.count('\n'),
-                    "last_indexed": datetime.now().isoformat(),
-                    "knowledge": knowledge
-                }
-                
-                # Compute and cache document embedding for semantic search
-                if self.semantic_search_enabled and self.embedding_provider.is_available():
-                    doc_embedding = self.embedding_provider.get_document_embedding(relative_path, content)
-                    if doc_embedding is not None:
-                        print(f"  🧠 Computed embedding for semantic search")
-                
-                indexed_count += 1
-                
+                pending.append((filepath, relative_path, file_hash))
             except Exception as e:
                 print(f"  ❌ Error indexing {filepath}: {e}")
         
+        # Embeddings are computed on this process, in batches, so the
+        # embedding cache stays in one place and the model sees full batches
+        embed = self.semantic_search_enabled and self.embedding_provider.is_available()
+        embedding_batch = {}
+        
+        indexed_count = 0
+        for (filepath, relative_path, file_hash), result in zip(pending, self._extract_pending(pending)):
+            if isinstance(result, Exception):
+                print(f"  ❌ Error indexing {filepath}: {result}")
+                continue
+            
+            print(f"  📄 {relative_path}")
+            content, knowledge = result
+            
+            # Store in index
+            self.index["documents"][relative_path] = {
+                "hash": file_hash,
+                "size": len(content),
+                "lines": content.count('\n'),
+                "last_indexed": datetime.now().isoformat(),
+                "knowledge": knowledge
+            }
+            
+            indexed_count += 1
+            
+            if embed:
+                embedding_batch[relative_path] = content
+                if len(embedding_batch) >= _EMBEDDING_BATCH_SIZE:
+                    self._embed_documents(embedding_batch)
+                    embedding_batch = {}
+        
+        if embedding_batch:
+            self._embed_documents(embedding_batch)
+        
         # Build knowledge graph and cross-references
         self._build_knowledge_graph()
         self._build_command_index()
@@ -672,36 +862,96 @@ class MultiRepoRAGEngine:
             "repo_type": self.config.get("repo_type")
         }
     
+    def _embed_documents(self, documents: dict[str, str]):
+        """Compute and cache document embeddings for semantic search."""
+        try:
+            embeddings = self.embedding_provider.get_document_embeddings(
+                documents, batch_size=_EMBEDDING_BATCH_SIZE
+            )
+        except Exception as e:
+            print(f"  ❌ Error computing embeddings: {e}")
+            return
+        if embeddings:
+            print(f"  🧠 Computed {len(embeddings)} embeddings for semantic search")
+    
+    def _read_and_extract(self, filepath: Path, relative_path: str) -> tuple[str, dict]:
+        """Read a file and extract its knowledge."""
+        content = _read_text(filepath)
+        
+        # Handle PDF files differently
+        if filepath.suffix.lower() == '.pdf':
+            knowledge = self._extract_pdf_knowledge(filepath, relative_path)
+        else:
+            knowledge = self.extract_knowledge(content, relative_path)
+        return content, knowledge
+    
+    def _extract_pending(self, pending: list[tuple]):
+        """Yield _read_and_extract results (or exceptions) in pending order.
+        
+        Large batches fan out over a process pool; extraction is pure
+        CPU-bound regex work, independent per file. Workers are spawned, not
+        forked: by now this process may hold the embedding model's threads.
+        """
+        workers = os.cpu_count() or 1
+        if len(pending) < _PARALLEL_MIN_FILES or workers < 2:
+            for filepath, relative_path, _ in pending:
+                yield _try_read_and_extract(self, filepath, relative_path)
+            return
+        
+        items = [(filepath, relative_path) for filepath, relative_path, _ in pending]
+        chunksize = max(1, min(64, len(items) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_index_worker, initargs=(self.config,)) as executor:
+            yield from executor.map(_index_worker, items, chunksize=chunksize)
+    
     def _build_knowledge_graph(self):
-        """Build relationships between concepts and files."""
+        """Build relationships between concepts and files.
+        
+        Command and configuration text is lowered once per document. A concept
+        word absent from all of a document's commands joined together cannot
+        match any single one, so such words (and whole concepts) are dropped
+        before the per-command checks.
+        """
         graph = defaultdict(list)
         
         # Build concept relationships
         for doc_path, doc_info in self.index["documents"].items():
             knowledge = doc_info.get("knowledge", {})
+            concepts = knowledge.get("concepts", [])
+            if not concepts:
+                continue
             
-            for concept in knowledge.get("concepts", []):
+            commands = [(cmd, cmd["command"].lower()) for cmd in knowledge.get("commands", [])]
+            all_commands = "\n".join(cmd_lower for _, cmd_lower in commands)
+            configs = [(config, config.get("content", "").lower())
+                       for config in knowledge.get("configurations", [])]
+            all_configs = "\n".join(content_lower for _, content_lower in configs)
+            
+            for concept in concepts:
                 concept_name = concept["name"].lower()
                 
                 # Link to commands
-                for cmd in knowledge.get("commands", []):
-                    if any(word in cmd["command"].lower() for word in concept_name.split()):
-                        graph[concept_name].append({
-                            "type": "command",
-                            "file": doc_path,
-                            "line": cmd["line"],
-                            "content": cmd["command"]
-                        })
+                words = [word for word in concept_name.split() if word in all_commands]
+                if words:
+                    for cmd, cmd_lower in commands:
+                        if any(word in cmd_lower for word in words):
+                            graph[concept_name].append({
+                                "type": "command",
+                                "file": doc_path,
+                                "line": cmd["line"],
+                                "content": cmd["command"]
+                            })
                 
                 # Link to configurations
-                for config in knowledge.get("configurations", []):
-                    if concept_name in config.get("content", "").lower():
-                        graph[concept_name].append({
-                            "type": "configuration",
-                            "file": doc_path,
-                            "line": config["line"],
-                            "content": config["content"]
-                        })
+                if concept_name in all_configs:
+                    for config, content_lower in configs:
+                        if concept_name in content_lower:
+                            graph[concept_name].append({
+                                "type": "configuration",
+                                "file": doc_path,
+                                "line": config["line"],
+                                "content": config["content"]
+                            })
         
         self.index["knowledge_graph"] = dict(graph)
     
@@ -722,7 +972,7 @@ class MultiRepoRAGEngine:
         
         self.index["command_index"] = dict(commands)
     
-    def _compute_project_stats(self) -> Dict:
+    def _compute_project_stats(self) -> dict:
         """Compute project statistics."""
         total_docs = len(self.index["documents"])
         total_commands = sum(
@@ -745,8 +995,7 @@ class MultiRepoRAGEngine:
     def _save_index(self):
         """Save index to disk."""
         self.rag_dir.mkdir(exist_ok=True)
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        self.index_file.write_bytes(dumps(self.index, indent=True))
     
     def _print_stats(self):
         """Print indexing statistics."""
@@ -760,8 +1009,13 @@ class MultiRepoRAGEngine:
   Knowledge Graph Nodes: {len(self.index.get('knowledge_graph', {}))}
         """)
     
-    def search(self, query: str, limit: int = 10, use_semantic: bool = None) -> Dict[str, List[Dict]]:
-        """Search across all indexed knowledge with hybrid exact + semantic matching."""
+    def search(self, query: str, limit: int = 10, use_semantic: bool = None,
+               command_tech: Optional[str] = None) -> dict[str, list[dict]]:
+        """Search across all indexed knowledge with hybrid exact + semantic matching.
+        
+        With command_tech, only commands whose text or type contains it are
+        collected and the other exact-match categories are left empty.
+        """
         results = {
             'concept_matches': [],
             'command_matches': [],
@@ -777,6 +1031,7 @@ class MultiRepoRAGEngine:
         # Expand query with synonyms for better matching
         expanded_queries = self._expand_search_terms(query)
         query_lower = query.lower()
+        tech = command_tech.lower() if command_tech else None
         
         # Semantic search component
         semantic_scores = {}
@@ -784,7 +1039,7 @@ class MultiRepoRAGEngine:
             document_texts = {}
             for doc_path, doc_info in self.index["documents"].items():
                 # Create searchable text from document
-                searchable_text = self._create_searchable_text(doc_info.get("knowledge", {}))
+                searchable_text = self._searchable_text(doc_path, doc_info)
                 if searchable_text:
                     document_texts[doc_path] = searchable_text
             
@@ -805,17 +1060,36 @@ class MultiRepoRAGEngine:
                         "score": int(similarity * 10)  # Convert to integer score
                     })
         
+        # Helper function for enhanced matching; defined once, not per document
+        def matches_query(text):
+            text_lower = text.lower()
+            return any(term in text_lower for term in expanded_queries)
+        
         for doc_path, doc_info in self.index["documents"].items():
             knowledge = doc_info.get("knowledge", {})
             
-            # Helper function for enhanced matching
-            def matches_query(text):
-                text_lower = text.lower()
-                return any(term in text_lower for term in expanded_queries)
-            
             # Calculate base score boost from semantic similarity
             semantic_boost = int(semantic_scores.get(doc_path, 0) * 5)  # 0-5 boost
             
+            # Search commands
+            for cmd in knowledge.get("commands", []):
+                command_lower = cmd["command"].lower()
+                if query_lower in command_lower:
+                    cmd_type = cmd.get("type", "shell")
+                    if tech is not None and tech not in command_lower and tech not in cmd_type.lower():
+                        continue
+                    score = 5 + semantic_boost
+                    results['command_matches'].append({
+                        "file": doc_path,
+                        "line": cmd.get("line", "?"),
+                        "command": cmd["command"],
+                        "type": cmd_type,
+                        "score": score
+                    })
+            
+            if tech is not None:
+                continue  # command listing; other categories would be discarded
+            
             # Search concepts with semantic matching
             for concept in knowledge.get("concepts", []):
                 concept_text = concept["name"].lower()
@@ -829,18 +1103,6 @@ class MultiRepoRAGEngine:
                         "score": score
                     })
             
-            # Search commands
-            for cmd in knowledge.get("commands", []):
-                if query_lower in cmd["command"].lower():
-                    score = 5 + semantic_boost
-                    results['command_matches'].append({
-                        "file": doc_path,
-                        "line": cmd.get("line", "?"),
-                        "command": cmd["command"],
-                        "type": cmd.get("type", "shell"),
-                        "score": score
-                    })
-            
             # Search configurations
             for config in knowledge.get("configurations", []):
                 if query_lower in config.get("content", "").lower():
@@ -864,14 +1126,14 @@ class MultiRepoRAGEngine:
                         "score": score
                     })
         
-        # Sort and limit each category
+        # Keep the top `limit` of each category; nlargest matches a stable
+        # descending sort + slice without sorting every match
         for category in results:
-            results[category].sort(key=lambda x: x["score"], reverse=True)
-            results[category] = results[category][:limit]
+            results[category] = heapq.nlargest(limit, results[category], key=itemgetter("score"))
         
         return results
     
-    def get_file_context(self, filepath: str) -> Dict:
+    def get_file_context(self, filepath: str) -> dict:
         """Get context and relationships for a specific file."""
         if filepath not in self.index["documents"]:
             return {"error": f"File not indexed: {filepath}"}
@@ -3,6 +3,12 @@
 Integration modules for external systems.
 """
 
-from .cli_interface import CLIInterface
+try:
+    from utils._lazy import attach
+except ImportError:
+    from ..utils._lazy import attach
 
-__all__ = ["CLIInterface"]
\ No newline at end of file
+# Resolved on first access so importing integrations.<module> stays cheap
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "cli_interface": ["CLIInterface"],
+})
@@ -8,7 +8,6 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
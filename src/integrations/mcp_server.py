@@ -9,7 +9,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Any
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
@@ -30,7 +30,7 @@ class ClaudeRAGMCPServer:
             self.engine = MultiRepoRAGEngine(str(self.project_root))
         return self.engine
     
-    async def search_documentation(self, query: str, category: str = "all", limit: int = 10) -> Dict[str, Any]:
+    async def search_documentation(self, query: str, category: str = "all", limit: int = 10) -> dict[str, Any]:
         """Search project documentation."""
         try:
             engine = self._get_engine()
@@ -50,7 +50,7 @@ class ClaudeRAGMCPServer:
                 "query": query
             }
     
-    async def troubleshoot_error(self, error: str) -> Dict[str, Any]:
+    async def troubleshoot_error(self, error: str) -> dict[str, Any]:
         """Find troubleshooting information for errors."""
         try:
             engine = self._get_engine()
@@ -77,7 +77,7 @@ class ClaudeRAGMCPServer:
                 "error_query": error
             }
     
-    async def get_file_context(self, filepath: str) -> Dict[str, Any]:
+    async def get_file_context(self, filepath: str) -> dict[str, Any]:
         """Get context for a specific file."""
         try:
             engine = self._get_engine()
@@ -95,7 +95,7 @@ class ClaudeRAGMCPServer:
                 "filepath": filepath
             }
     
-    async def get_related_commands(self, technology: str, limit: int = 15) -> Dict[str, Any]:
+    async def get_related_commands(self, technology: str, limit: int = 15) -> dict[str, Any]:
         """Find commands related to a technology."""
         try:
             engine = self._get_engine()
@@ -125,7 +125,7 @@ class ClaudeRAGMCPServer:
                 "technology": technology
             }
     
-    async def get_project_stats(self) -> Dict[str, Any]:
+    async def get_project_stats(self) -> dict[str, Any]:
         """Get project statistics."""
         try:
             engine = self._get_engine()
@@ -147,7 +147,7 @@ class ClaudeRAGMCPServer:
                 "error": str(e)
             }
     
-    async def reindex_project(self, force: bool = False) -> Dict[str, Any]:
+    async def reindex_project(self, force: bool = False) -> dict[str, Any]:
         """Reindex the project."""
         try:
             engine = self._get_engine()
@@ -165,7 +165,7 @@ class ClaudeRAGMCPServer:
                 "force_reindex": force
             }
     
-    def get_tool_definitions(self) -> Dict[str, Any]:
+    def get_tool_definitions(self) -> dict[str, Any]:
         """Get MCP tool definitions."""
         return {
             "search_documentation": {
@@ -226,7 +226,7 @@ class ClaudeRAGMCPServer:
             }
         }
     
-    async def handle_tool_call(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_tool_call(self, tool_name: str, parameters: dict[str, Any]) -> dict[str, Any]:
         """Handle MCP tool calls."""
         handlers = {
             "search_documentation": self.search_documentation,
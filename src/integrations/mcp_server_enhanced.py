@@ -9,13 +9,14 @@ import json
 import sys
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Any, Optional, Union
 from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.rag_engine import MultiRepoRAGEngine
+from utils._version import __version__
 
 
 # Configure logging
@@ -34,7 +35,7 @@ class MCPServer:
         self.engine = None
         self.server_info = {
             "name": "claude-rag-toolkit",
-            "version": "1.0.0",
+            "version": __version__,
             "description": "Multi-repository documentation RAG system for Claude Code",
             "capabilities": {
                 "tools": True,
@@ -50,7 +51,7 @@ class MCPServer:
             self.engine = MultiRepoRAGEngine(str(self.project_root))
         return self.engine
     
-    async def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_initialize(self, params: dict[str, Any]) -> dict[str, Any]:
         """Handle MCP initialization request."""
         self.session_id = params.get("sessionId", datetime.now().isoformat())
         
@@ -67,7 +68,7 @@ class MCPServer:
                           "Use get_file_context for understanding file relationships."
         }
     
-    async def handle_list_tools(self) -> Dict[str, Any]:
+    async def handle_list_tools(self) -> dict[str, Any]:
         """List available MCP tools."""
         tools = [
             {
@@ -172,7 +173,7 @@ class MCPServer:
         
         return {"tools": tools}
     
-    async def handle_call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_call_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Handle tool invocation."""
         try:
             engine = self._get_engine()
@@ -325,7 +326,7 @@ class MCPServer:
                 }
             }
     
-    def _format_search_results(self, results: Dict, query: str) -> str:
+    def _format_search_results(self, results: dict, query: str) -> str:
         """Format search results for display."""
         output = [f"🔍 Search Results for: '{query}'\n"]
         
@@ -353,7 +354,7 @@ class MCPServer:
         
         return "\n".join(output)
     
-    def _format_troubleshooting_results(self, results: List, error: str) -> str:
+    def _format_troubleshooting_results(self, results: list, error: str) -> str:
         """Format troubleshooting results."""
         output = [f"🔧 Troubleshooting Results for: '{error}'\n"]
         
@@ -382,7 +383,7 @@ class MCPServer:
         
         return "\n".join(output)
     
-    def _format_file_context(self, context: Dict, filepath: str) -> str:
+    def _format_file_context(self, context: dict, filepath: str) -> str:
         """Format file context information."""
         output = [f"📄 File Context: {filepath}\n"]
         
@@ -405,7 +406,7 @@ class MCPServer:
         
         return "\n".join(output)
     
-    def _format_command_results(self, commands: List, technology: str) -> str:
+    def _format_command_results(self, commands: list, technology: str) -> str:
         """Format command results."""
         output = [f"💻 Commands for: {technology}\n"]
         
@@ -426,7 +427,7 @@ class MCPServer:
         
         return "\n".join(output)
     
-    def _format_project_stats(self, stats: Dict, index_info: Dict) -> str:
+    def _format_project_stats(self, stats: dict, index_info: dict) -> str:
         """Format project statistics."""
         output = ["📊 Project Statistics\n"]
         
@@ -442,7 +443,7 @@ class MCPServer:
         
         return "\n".join(output)
     
-    def _format_reindex_results(self, results: Dict, force: bool) -> str:
+    def _format_reindex_results(self, results: dict, force: bool) -> str:
         """Format reindex results."""
         output = ["🔄 Reindex Results\n"]
         
@@ -462,7 +463,7 @@ class MCPServer:
         
         return "\n".join(output)
     
-    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
         """Handle JSON-RPC 2.0 request."""
         # Validate request structure
         if "jsonrpc" not in request or request["jsonrpc"] != "2.0":
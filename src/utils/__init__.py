@@ -3,6 +3,9 @@
 Utility functions and classes for the Claude RAG Toolkit.
 """
 
-from .repo_detector import RepositoryDetector
+from ._lazy import attach
 
-__all__ = ["RepositoryDetector"]
\ No newline at end of file
+# Resolved on first access so importing utils._json and friends stays cheap
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "repo_detector": ["RepositoryDetector"],
+})
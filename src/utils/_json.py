@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+JSON serialization shim.
+Dispatches to orjson, then ujson, then the standard library. dumps() always
+returns UTF-8 bytes and loads() accepts bytes or str, so callers can use
+binary file I/O regardless of which backend is installed.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+    try:
+        import ujson as _backend
+        BACKEND = "ujson"
+        # ujson raises a plain ValueError subclass, not json.JSONDecodeError
+        JSONDecodeError = ValueError
+    except ImportError:
+        import json as _backend
+        BACKEND = "json"
+        JSONDecodeError = _backend.JSONDecodeError
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        if indent:
+            return _backend.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        return _backend.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return _backend.loads(data)
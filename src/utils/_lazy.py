@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+PEP 562 lazy attributes for the toolkit's subpackages.
+Uses lazy_loader when it is installed and an equivalent module-level
+__getattr__ otherwise, so `import core` does not import the RAG engine.
+"""
+
+import importlib
+from typing import Any, Callable
+
+try:
+    import lazy_loader as _lazy
+except ImportError:
+    _lazy = None
+
+
+def attach(
+    package_name: str, submod_attrs: dict[str, list[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]], list[str]]:
+    """Return (__getattr__, __dir__, __all__) for package_name.
+
+    submod_attrs maps a submodule name, relative to the package, to the
+    public names it provides.
+    """
+    if _lazy is not None:
+        return _lazy.attach(package_name, submod_attrs=submod_attrs)
+
+    __all__ = [attr for attrs in submod_attrs.values() for attr in attrs]
+    attr_to_submod = {attr: mod for mod, attrs in submod_attrs.items() for attr in attrs}
+
+    def __getattr__(name):
+        submod = attr_to_submod.get(name)
+        if submod is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        package = importlib.import_module(package_name)
+        value = getattr(importlib.import_module(f"{package_name}.{submod}"), name)
+        setattr(package, name, value)
+        return value
+
+    def __dir__():
+        return sorted(list(vars(importlib.import_module(package_name))) + __all__)
+
+    return __getattr__, __dir__, list(__all__)
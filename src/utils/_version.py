@@ -0,0 +1,7 @@
+"""
+Single source of the toolkit version.
+Read statically by the build (pyproject.toml) and imported at runtime, so
+nothing needs importlib.metadata to report it.
+"""
+
+__version__ = "1.0.0"
@@ -7,8 +7,9 @@ Handles text embeddings using Sentence Transformers for improved search capabili
 import os
 import json
 import hashlib
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple
+from typing import Optional, Any
 from datetime import datetime
 import logging
 
@@ -27,13 +28,6 @@ except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
     SentenceTransformer = None
 
-try:
-    from sklearn.metrics.pairwise import cosine_similarity
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-    cosine_similarity = None
-
 
 class EmbeddingProvider:
     """
@@ -50,6 +44,11 @@ class EmbeddingProvider:
         self.model = None
         self.embeddings_cache = {}
         self.document_embeddings = {}
+        # text_hash -> doc_id with a cached embedding for that exact text
+        self._hash_to_doc = {}
+        
+        # Repeated queries (and session replays) skip the model entirely
+        self._encode_query = lru_cache(maxsize=1024)(self._encode_query_uncached)
         
         # Initialize model if dependencies are available
         self._initialize_model()
@@ -75,8 +74,7 @@ class EmbeddingProvider:
         """Check if all required dependencies are available."""
         return all([
             NUMPY_AVAILABLE,
-            SENTENCE_TRANSFORMERS_AVAILABLE, 
-            SKLEARN_AVAILABLE
+            SENTENCE_TRANSFORMERS_AVAILABLE
         ])
     
     def is_available(self) -> bool:
@@ -99,12 +97,18 @@ class EmbeddingProvider:
                         self.document_embeddings[doc_id] = embedding
                     
                 self.embeddings_cache = cached_data
+                self._hash_to_doc = {
+                    meta.get('text_hash'): doc_id
+                    for doc_id, meta in cached_data.items()
+                    if doc_id in self.document_embeddings
+                }
                 logging.info(f"Loaded {len(self.document_embeddings)} cached embeddings")
                 
             except Exception as e:
                 logging.warning(f"Failed to load embedding cache: {e}")
                 self.embeddings_cache = {}
                 self.document_embeddings = {}
+                self._hash_to_doc = {}
     
     def _save_cache(self):
         """Save embeddings cache to disk."""
@@ -149,6 +153,12 @@ class EmbeddingProvider:
             if cached_hash == text_hash and doc_id in self.document_embeddings:
                 return self.document_embeddings[doc_id]
         
+        # Identical text under another id (copied docs, generated configs)
+        twin_embedding = None if force_recompute else self._twin_embedding(text_hash)
+        if twin_embedding is not None:
+            self._store_embedding(doc_id, text_hash, twin_embedding)
+            return twin_embedding
+        
         # Compute new embedding
         try:
             # Truncate very long documents to avoid memory issues
@@ -159,12 +169,7 @@ class EmbeddingProvider:
             embedding = self.model.encode([text])[0]
             
             # Cache the embedding
-            self.document_embeddings[doc_id] = embedding
-            self.embeddings_cache[doc_id] = {
-                'text_hash': text_hash,
-                'model_name': self.model_name,
-                'computed_at': datetime.now().isoformat()
-            }
+            self._store_embedding(doc_id, text_hash, embedding)
             
             return embedding
             
@@ -172,6 +177,85 @@ class EmbeddingProvider:
             logging.error(f"Failed to compute embedding for {doc_id}: {e}")
             return None
     
+    def get_document_embeddings(self, documents: dict[str, str], batch_size: int = 64) -> dict[str, np.ndarray]:
+        """
+        Get or compute embeddings for many documents at once.
+        
+        Cached and duplicate texts are resolved first; the rest go to the
+        model in batched encode calls.
+        
+        Args:
+            documents: Dictionary of doc_id -> document text
+            batch_size: Texts per model forward pass
+            
+        Returns:
+            Dictionary of doc_id -> embedding for every document embedded
+        """
+        if not self.is_available():
+            return {}
+        
+        embeddings = {}
+        to_encode = {}  # text_hash -> (truncated text, [doc_ids])
+        for doc_id, text in documents.items():
+            text_hash = self._compute_text_hash(text)
+            cached = self.embeddings_cache.get(doc_id)
+            if cached and cached.get('text_hash') == text_hash and doc_id in self.document_embeddings:
+                embeddings[doc_id] = self.document_embeddings[doc_id]
+                continue
+            twin_embedding = self._twin_embedding(text_hash)
+            if twin_embedding is not None:
+                self._store_embedding(doc_id, text_hash, twin_embedding)
+                embeddings[doc_id] = twin_embedding
+                continue
+            if text_hash not in to_encode:
+                # Truncate very long documents to avoid memory issues
+                max_length = 5000  # characters
+                if len(text) > max_length:
+                    text = text[:max_length] + "..."
+                to_encode[text_hash] = (text, [])
+            to_encode[text_hash][1].append(doc_id)
+        
+        if not to_encode:
+            return embeddings
+        
+        try:
+            vectors = self.model.encode([text for text, _ in to_encode.values()], batch_size=batch_size)
+        except Exception as e:
+            logging.error(f"Failed to compute embeddings for {len(to_encode)} documents: {e}")
+            return embeddings
+        
+        for (text_hash, (_, doc_ids)), embedding in zip(to_encode.items(), vectors):
+            for doc_id in doc_ids:
+                self._store_embedding(doc_id, text_hash, embedding)
+                embeddings[doc_id] = embedding
+        
+        return embeddings
+    
+    def _twin_embedding(self, text_hash: str) -> Optional[np.ndarray]:
+        """Cached embedding of another document whose current text has text_hash."""
+        twin = self._hash_to_doc.get(text_hash)
+        if twin not in self.document_embeddings:
+            return None
+        # The twin may have been re-embedded with different text since
+        if self.embeddings_cache.get(twin, {}).get('text_hash') != text_hash:
+            return None
+        return self.document_embeddings[twin]
+    
+    def _store_embedding(self, doc_id: str, text_hash: str, embedding: np.ndarray):
+        """Cache a document embedding and index it by text hash."""
+        # Drop the mapping for this document's previous text
+        old_hash = self.embeddings_cache.get(doc_id, {}).get('text_hash')
+        if old_hash != text_hash and self._hash_to_doc.get(old_hash) == doc_id:
+            del self._hash_to_doc[old_hash]
+        
+        self.document_embeddings[doc_id] = embedding
+        self.embeddings_cache[doc_id] = {
+            'text_hash': text_hash,
+            'model_name': self.model_name,
+            'computed_at': datetime.now().isoformat()
+        }
+        self._hash_to_doc[text_hash] = doc_id
+    
     def get_query_embedding(self, query: str) -> Optional[np.ndarray]:
         """
         Get embedding for a search query.
@@ -186,12 +270,21 @@ class EmbeddingProvider:
             return None
             
         try:
-            return self.model.encode([query])[0]
+            return self._encode_query(query)
         except Exception as e:
             logging.error(f"Failed to compute query embedding: {e}")
             return None
     
-    def compute_similarity(self, query_embedding: np.ndarray, document_embeddings: Dict[str, np.ndarray]) -> Dict[str, float]:
+    def _encode_query_uncached(self, query: str) -> np.ndarray:
+        """Encode a single query; wrapped in a per-instance LRU cache.
+        
+        The result is shared by every cache hit, so it is made read-only.
+        """
+        embedding = np.array(self.model.encode([query])[0])
+        embedding.flags.writeable = False
+        return embedding
+    
+    def compute_similarity(self, query_embedding: np.ndarray, document_embeddings: dict[str, np.ndarray]) -> dict[str, float]:
         """
         Compute cosine similarity between query and document embeddings.
         
@@ -208,20 +301,25 @@ class EmbeddingProvider:
         similarities = {}
         
         try:
-            # Reshape query embedding for sklearn
-            query_vector = query_embedding.reshape(1, -1)
+            # One matrix-vector product over unit rows scores every document;
+            # zero vectors score 0
+            doc_ids = list(document_embeddings)
+            matrix = np.stack([np.asarray(document_embeddings[doc_id]).ravel() for doc_id in doc_ids])
+            query_vector = np.asarray(query_embedding).ravel()
+            
+            doc_norms = np.linalg.norm(matrix, axis=1)
+            doc_norms[doc_norms == 0] = 1
+            query_norm = np.linalg.norm(query_vector) or 1
             
-            for doc_id, doc_embedding in document_embeddings.items():
-                doc_vector = doc_embedding.reshape(1, -1)
-                similarity = cosine_similarity(query_vector, doc_vector)[0][0]
-                similarities[doc_id] = float(similarity)
+            scores = (matrix @ query_vector) / (doc_norms * query_norm)
+            similarities = dict(zip(doc_ids, scores.tolist()))
                 
         except Exception as e:
             logging.error(f"Failed to compute similarities: {e}")
             
         return similarities
     
-    def find_similar_documents(self, query: str, document_texts: Dict[str, str], top_k: int = 10, similarity_threshold: float = 0.3) -> List[Tuple[str, float]]:
+    def find_similar_documents(self, query: str, document_texts: dict[str, str], top_k: int = 10, similarity_threshold: float = 0.3) -> list[tuple[str, float]]:
         """
         Find documents most similar to a query using semantic search.
         
@@ -261,7 +359,7 @@ class EmbeddingProvider:
         
         return results[:top_k]
     
-    def expand_query_with_embeddings(self, query: str, document_texts: Dict[str, str], expansion_limit: int = 5) -> List[str]:
+    def expand_query_with_embeddings(self, query: str, document_texts: dict[str, str], expansion_limit: int = 5) -> list[str]:
         """
         Expand a query with semantically similar terms found in the document corpus.
         
@@ -308,6 +406,7 @@ class EmbeddingProvider:
         """Clear all cached embeddings."""
         self.embeddings_cache = {}
         self.document_embeddings = {}
+        self._hash_to_doc = {}
         
         # Remove cache files
         cache_file = self.cache_dir / "embeddings.json"
@@ -318,7 +417,7 @@ class EmbeddingProvider:
         if embeddings_file.exists():
             embeddings_file.unlink()
     
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self) -> dict[str, Any]:
         """Get statistics about cached embeddings."""
         return {
             "is_available": self.is_available(),
@@ -329,7 +428,6 @@ class EmbeddingProvider:
             ) / (1024 * 1024) if self.document_embeddings and NUMPY_AVAILABLE else 0,
             "dependencies": {
                 "numpy": NUMPY_AVAILABLE,
-                "sentence_transformers": SENTENCE_TRANSFORMERS_AVAILABLE,
-                "sklearn": SKLEARN_AVAILABLE
+                "sentence_transformers": SENTENCE_TRANSFORMERS_AVAILABLE
             }
         }
\ No newline at end of file
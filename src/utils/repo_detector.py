@@ -6,7 +6,7 @@ Automatically determines the type of repository and appropriate RAG configuratio
 
 import os
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Optional
 
 
 class RepositoryDetector:
@@ -18,7 +18,7 @@ class RepositoryDetector:
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
     
-    def detect_repository_type(self) -> Tuple[str, float, Dict]:
+    def detect_repository_type(self) -> tuple[str, float, dict]:
         """
         Simplified universal repository detection.
         Returns universal type for all repositories.
@@ -60,31 +60,31 @@ class RepositoryDetector:
         print(f"🔍 Detected repository type: {repo_type} (confidence: {confidence:.2f})")
         return repo_type
     
-    def _detect_mlops_platform(self) -> Tuple[str, float, List[str]]:
+    def _detect_mlops_platform(self) -> tuple[str, float, list[str]]:
         """Legacy method - no longer used."""
         return "universal", 0.0, []
 
-    def _detect_ml_model(self) -> Tuple[str, float, List[str]]:
+    def _detect_ml_model(self) -> tuple[str, float, list[str]]:
         """Legacy method - no longer used."""
         return "universal", 0.0, []
 
-    def _detect_kubernetes(self) -> Tuple[str, float, List[str]]:
+    def _detect_kubernetes(self) -> tuple[str, float, list[str]]:
         """Legacy method - no longer used."""
         return "universal", 0.0, []
 
-    def _detect_ansible(self) -> Tuple[str, float, List[str]]:
+    def _detect_ansible(self) -> tuple[str, float, list[str]]:
         """Legacy method - no longer used."""
         return "universal", 0.0, []
 
-    def _detect_python(self) -> Tuple[str, float, List[str]]:
+    def _detect_python(self) -> tuple[str, float, list[str]]:
         """Legacy method - no longer used."""
         return "universal", 0.0, []
 
-    def _detect_nodejs(self) -> Tuple[str, float, List[str]]:
+    def _detect_nodejs(self) -> tuple[str, float, list[str]]:
         """Legacy method - no longer used."""
         return "universal", 0.0, []
 
-    def _detect_documentation(self) -> Tuple[str, float, List[str]]:
+    def _detect_documentation(self) -> tuple[str, float, list[str]]:
         """Legacy method - no longer used."""
         return "universal", 0.0, []
     
@@ -101,7 +101,7 @@ class RepositoryDetector:
         except:
             return False
     
-    def _file_contains(self, filename: str, keywords: List[str]) -> bool:
+    def _file_contains(self, filename: str, keywords: list[str]) -> bool:
         """Check if a file contains any of the given keywords."""
         try:
             filepath = self.project_root / filename
@@ -113,7 +113,7 @@ class RepositoryDetector:
         except:
             return False
     
-    def get_repository_info(self) -> Dict:
+    def get_repository_info(self) -> dict:
         """Get comprehensive repository information."""
         info = {
             "project_root": str(self.project_root),
@@ -156,7 +156,7 @@ class RepositoryDetector:
         
         return info
     
-    def generate_config(self, repo_type: str) -> Dict:
+    def generate_config(self, repo_type: str) -> dict:
         """Generate universal configuration that works for all repository types."""
         # Universal configuration that works for all project types
         return {
@@ -223,7 +223,7 @@ class RepositoryDetector:
             }
         }
     
-    def analyze_project(self) -> Dict:
+    def analyze_project(self) -> dict:
         """Comprehensive project analysis."""
         repo_type, confidence, analysis = self.detect_repository_type()
         config = self.generate_config(repo_type)
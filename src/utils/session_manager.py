@@ -4,16 +4,25 @@ Session Management System for Claude RAG Toolkit
 Tracks progress, decisions, and context across development sessions.
 """
 
+import io
 import json
 import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Optional, Any, Iterator, TextIO
 from dataclasses import dataclass, asdict
 import uuid
 
 
+def _display_time(timestamp: str) -> str:
+    """Render an isoformat() timestamp as 'YYYY-MM-DD HH:MM:SS'.
+    
+    isoformat() always puts the 'T' at index 10, so splice instead of replace().
+    """
+    return timestamp[:10] + ' ' + timestamp[11:19]
+
+
 @dataclass
 class SessionState:
     """Represents the current state of a development session."""
@@ -30,13 +39,13 @@ class SessionState:
     final_commit: Optional[str] = None
     
     # Progress tracking
-    objectives: List[str] = None
-    progress_log: List[Dict[str, Any]] = None
-    blockers: List[Dict[str, str]] = None
-    decisions: List[Dict[str, str]] = None
+    objectives: list[str] = None
+    progress_log: list[dict[str, Any]] = None
+    blockers: list[dict[str, str]] = None
+    decisions: list[dict[str, str]] = None
     
     # Metrics
-    files_modified: List[str] = None
+    files_modified: list[str] = None
     lines_added: int = 0
     lines_removed: int = 0
     
@@ -62,6 +71,10 @@ class SessionManager:
         self.current_session_file = self.sessions_dir / ".current_session"
         self.sessions_index = self.sessions_dir / "index.json"
         
+        # Sessions loaded or saved by this manager, keyed by session_id; a
+        # manager lives for one command, so later lookups skip the JSON load
+        self._session_cache: dict[str, SessionState] = {}
+        
         # Ensure sessions directory exists
         self.sessions_dir.mkdir(exist_ok=True)
         
@@ -69,7 +82,7 @@ class SessionManager:
         if not self.sessions_index.exists():
             self._save_sessions_index([])
     
-    def _get_git_info(self) -> Dict[str, str]:
+    def _get_git_info(self) -> dict[str, str]:
         """Get current Git state information."""
         try:
             # Get current branch
@@ -97,7 +110,7 @@ class SessionManager:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return {"branch": "unknown", "commit": "unknown"}
     
-    def _get_git_status(self) -> Dict[str, Any]:
+    def _get_git_status(self) -> dict[str, Any]:
         """Get detailed Git status information."""
         try:
             # Get status
@@ -125,7 +138,7 @@ class SessionManager:
         except (subprocess.CalledProcessError, FileNotFoundError):
             return {"modified_files": [], "clean": True}
     
-    def _get_git_diff_stats(self, from_commit: str, to_commit: str = "HEAD") -> Dict[str, int]:
+    def _get_git_diff_stats(self, from_commit: str, to_commit: str = "HEAD") -> dict[str, int]:
         """Get diff statistics between commits."""
         try:
             diff_result = subprocess.run(
@@ -151,7 +164,7 @@ class SessionManager:
         except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
             return {"lines_added": 0, "lines_removed": 0}
     
-    def _load_sessions_index(self) -> List[Dict[str, Any]]:
+    def _load_sessions_index(self) -> list[dict[str, Any]]:
         """Load the sessions index."""
         try:
             with open(self.sessions_index, 'r') as f:
@@ -159,7 +172,7 @@ class SessionManager:
         except (FileNotFoundError, json.JSONDecodeError):
             return []
     
-    def _save_sessions_index(self, sessions: List[Dict[str, Any]]):
+    def _save_sessions_index(self, sessions: list[dict[str, Any]]):
         """Save the sessions index."""
         with open(self.sessions_index, 'w') as f:
             json.dump(sessions, f, indent=2)
@@ -169,18 +182,25 @@ class SessionManager:
         session_file = self.sessions_dir / f"{session.session_id}.json"
         with open(session_file, 'w') as f:
             json.dump(asdict(session), f, indent=2)
+        self._session_cache[session.session_id] = session
     
     def _load_session(self, session_id: str) -> Optional[SessionState]:
-        """Load a session from disk."""
+        """Load a session from disk, reusing a copy this manager already holds."""
+        session = self._session_cache.get(session_id)
+        if session is not None:
+            return session
+        
         session_file = self.sessions_dir / f"{session_id}.json"
         try:
             with open(session_file, 'r') as f:
                 data = json.load(f)
-                return SessionState(**data)
         except (FileNotFoundError, json.JSONDecodeError):
             return None
+        
+        session = self._session_cache[session_id] = SessionState(**data)
+        return session
     
-    def start_session(self, name: str, description: str = "", objectives: List[str] = None) -> SessionState:
+    def start_session(self, name: str, description: str = "", objectives: list[str] = None) -> SessionState:
         """Start a new development session."""
         # End any active session first
         current = self.get_current_session()
@@ -379,7 +399,7 @@ class SessionManager:
         
         return True
     
-    def list_sessions(self) -> List[Dict[str, Any]]:
+    def list_sessions(self) -> list[dict[str, Any]]:
         """List all sessions."""
         return self._load_sessions_index()
     
@@ -389,64 +409,77 @@ class SessionManager:
     
     def generate_session_report(self, session_id: str) -> str:
         """Generate a detailed report for a session."""
+        buffer = io.StringIO()
+        if not self.stream_session_report(session_id, buffer):
+            return "Session not found."
+        return buffer.getvalue()
+    
+    def stream_session_report(self, session_id: str, out: TextIO) -> bool:
+        """Write the session report to out line by line; False if no such session."""
         session = self._load_session(session_id)
         if not session:
-            return "Session not found."
+            return False
         
-        report = []
-        report.append(f"# Session Report: {session.name}")
-        report.append(f"**Session ID**: {session.session_id}")
-        report.append(f"**Status**: {session.status}")
-        report.append(f"**Started**: {session.start_time}")
+        lines = self._iter_report_lines(session)
+        out.write(next(lines))
+        for line in lines:
+            out.write("\n")
+            out.write(line)
+        return True
+    
+    def _iter_report_lines(self, session: SessionState) -> Iterator[str]:
+        """Yield the Markdown lines of a session report."""
+        yield f"# Session Report: {session.name}"
+        yield f"**Session ID**: {session.session_id}"
+        yield f"**Status**: {session.status}"
+        yield f"**Started**: {session.start_time}"
         
         if session.end_time:
-            report.append(f"**Ended**: {session.end_time}")
+            yield f"**Ended**: {session.end_time}"
         
         if session.description:
-            report.append(f"**Description**: {session.description}")
+            yield f"**Description**: {session.description}"
         
         # Objectives
         if session.objectives:
-            report.append("## Objectives")
+            yield "## Objectives"
             for obj in session.objectives:
-                report.append(f"- {obj}")
+                yield f"- {obj}"
         
         # Git Information
-        report.append("## Git Information")
-        report.append(f"- **Branch**: {session.initial_branch}")
-        report.append(f"- **Initial Commit**: {session.initial_commit[:8]}")
+        yield "## Git Information"
+        yield f"- **Branch**: {session.initial_branch}"
+        yield f"- **Initial Commit**: {session.initial_commit[:8]}"
         if session.final_commit:
-            report.append(f"- **Final Commit**: {session.final_commit[:8]}")
+            yield f"- **Final Commit**: {session.final_commit[:8]}"
         
         if session.lines_added or session.lines_removed:
-            report.append(f"- **Changes**: +{session.lines_added} -{session.lines_removed} lines")
+            yield f"- **Changes**: +{session.lines_added} -{session.lines_removed} lines"
         
         # Progress Log
         if session.progress_log:
-            report.append("## Progress Log")
+            yield "## Progress Log"
             for entry in session.progress_log:
-                timestamp = entry["timestamp"][:19].replace('T', ' ')
-                report.append(f"- **{timestamp}**: {entry['notes']}")
+                timestamp = _display_time(entry["timestamp"])
+                yield f"- **{timestamp}**: {entry['notes']}"
         
         # Blockers
         if session.blockers:
-            report.append("## Blockers")
+            yield "## Blockers"
             for blocker in session.blockers:
-                timestamp = blocker["timestamp"][:19].replace('T', ' ')
+                timestamp = _display_time(blocker["timestamp"])
                 status = blocker.get("status", "open")
-                report.append(f"- **{timestamp}** [{status}]: {blocker['description']}")
+                yield f"- **{timestamp}** [{status}]: {blocker['description']}"
         
         # Decisions
         if session.decisions:
-            report.append("## Decisions")
+            yield "## Decisions"
             for decision in session.decisions:
-                timestamp = decision["timestamp"][:19].replace('T', ' ')
-                report.append(f"- **{timestamp}**: {decision['description']}")
+                timestamp = _display_time(decision["timestamp"])
+                yield f"- **{timestamp}**: {decision['description']}"
         
         # Modified Files
         if session.files_modified:
-            report.append("## Modified Files")
+            yield "## Modified Files"
             for file_mod in session.files_modified:
-                report.append(f"- {file_mod}")
-        
-        return "\n".join(report)
\ No newline at end of file
+                yield f"- {file_mod}"
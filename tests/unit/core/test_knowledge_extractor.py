@@ -124,6 +124,15 @@ class TestKnowledgeExtractor:
                       len(result["dependencies"]) + len(result["concepts"]))
         assert total_items >= 0  # Should extract something from Python code
 
+    def test_one_line_docstring_does_not_hide_following_code(self):
+        """A docstring closed on its own line leaves later definitions visible."""
+        extractor = KnowledgeExtractor({"repo_type": "generic"})
+
+        content = 'def first():\n    """Short docstring."""\n    return 1\n\ndef second():\n    pass'
+        result = extractor.extract_knowledge(content, "module.py", ".py")
+
+        assert [f["name"] for f in result["functions"]] == ["first", "second"]
+
     def test_extract_from_shell(self):
         """Test extraction from shell script content."""
         config = {
@@ -218,6 +227,17 @@ pip install requests
         # May not extract file paths as cross-references in this simple format
         assert len(cross_refs) >= 0
 
+    def test_file_references_one_match_per_path(self):
+        """Each path yields one reference, in line order, without overlapping fragments."""
+        extractor = KnowledgeExtractor({"repo_type": "generic"})
+        
+        refs = extractor._extract_file_references(
+            "  Run scripts/setup.sh, then see //img.shields.io/ci.yml and docs/a.md  "
+        )
+        
+        assert [ref["file"] for ref in refs] == ["scripts/setup.sh", "//img.shields.io/ci.yml", "docs/a.md"]
+        assert refs[0]["context"].startswith("Run scripts/setup.sh")
+
     def test_extract_troubleshooting_sections(self):
         """Test troubleshooting section extraction."""
         config = {"repo_type": "mlops-platform"}
@@ -280,6 +300,22 @@ def setup():
         assert len(mlops_result["concepts"]) >= 1
         assert len(python_result["concepts"]) >= 1
 
+    def test_mlops_enhancement_tags_each_keyword_line(self):
+        """Kubernetes, Ansible and service keywords each yield their own entry."""
+        extractor = KnowledgeExtractor({"repo_type": "mlops-platform"})
+
+        content = "apiVersion: v1\n- name: Install Harbor\nplain text\nmlflow_port: 5000"
+        result = extractor.extract_knowledge(content, "notes.txt", ".txt")
+
+        mlops = [c for c in result["configurations"] if c.get("category") == "mlops"]
+        assert [(c["line"], c["type"]) for c in mlops] == [
+            (0, "kubernetes_resource"),
+            (1, "mlops_service_config"),
+            (3, "mlops_service_config"),
+        ]
+        tasks = [c["name"] for c in result["concepts"] if c.get("type") == "ansible_task"]
+        assert tasks == ["Ansible Task: Install Harbor"]
+
     def test_keyword_filtering(self):
         """Test that keyword filtering works correctly."""
         config = {
@@ -5,6 +5,7 @@ Focuses on actual functionality rather than complex mocking.
 
 import pytest
 import json
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -103,10 +104,14 @@ class TestMultiRepoRAGEngineSimple:
         
         # Hash should be consistent
         assert isinstance(file_hash, str)
-        assert len(file_hash) == 32  # MD5 hex digest length (not SHA256)
+        assert len(file_hash) == 32  # 16-byte BLAKE2b hex digest
         
         # Same content should produce same hash
         assert file_hash == engine.compute_file_hash(test_file)
+        
+        # Different content should not
+        test_file.write_text(test_content + "\n")
+        assert file_hash != engine.compute_file_hash(test_file)
 
     def test_get_statistics_basic(self, temp_dir):
         """Test getting project statistics."""
@@ -167,6 +172,20 @@ class TestMultiRepoRAGEngineSimple:
         engine2 = MultiRepoRAGEngine(str(temp_dir))
         assert engine2.index["test_key"] == "test_value"
 
+    def test_load_meta_only_drops_document_payload(self, temp_dir):
+        """load_meta_only returns the summary fields and nothing else."""
+        engine = MultiRepoRAGEngine(str(temp_dir))
+        engine.index["documents"] = {"docs/a.md": {"knowledge": {}}}
+        engine.index["recent_changes"] = [{"file": "docs/a.md", "status": "M"}]
+        engine._save_index()
+        
+        meta = MultiRepoRAGEngine.load_meta_only(engine.index_file)
+        
+        assert meta["repo_type"] == engine.index["repo_type"]
+        assert meta["recent_changes"] == [{"file": "docs/a.md", "status": "M"}]
+        assert "documents" not in meta
+        assert "knowledge_graph" not in meta
+
     def test_should_index_file_basic(self, temp_dir):
         """Test file indexing decision logic."""
         engine = MultiRepoRAGEngine(str(temp_dir))
@@ -225,6 +244,111 @@ class TestMultiRepoRAGEngineSimple:
         # Should have processed at least some content
         assert "indexed_files" in result or "processed_files" in result or len(result) >= 0
 
+    def test_index_project_parallel_matches_serial(self, temp_dir):
+        """Pooled extraction indexes the same knowledge as the serial path."""
+        for i in range(4):
+            (temp_dir / f"doc{i}.md").write_text(f"# Doc {i}\n```bash\necho {i}\n```\n")
+
+        serial = MultiRepoRAGEngine(str(temp_dir))
+        serial.index_project()
+
+        with patch("core.rag_engine._PARALLEL_MIN_FILES", 2), \
+                patch("core.rag_engine.os.cpu_count", return_value=2):
+            pooled = MultiRepoRAGEngine(str(temp_dir))
+            pooled.index_project(force_reindex=True)
+
+        assert set(pooled.index["documents"]) == set(serial.index["documents"])
+        for path, doc in serial.index["documents"].items():
+            assert pooled.index["documents"][path]["knowledge"] == doc["knowledge"]
+
+    def test_read_text_matches_text_mode_decoding(self, temp_dir):
+        """Byte-level reading keeps read_text's newline and error handling."""
+        from core.rag_engine import _read_text
+
+        sample = temp_dir / "mixed.md"
+        sample.write_bytes(b"# Title\r\nold mac\rline\xff\n\xc3\xa9\r")
+
+        assert _read_text(sample) == sample.read_text(encoding="utf-8", errors="ignore")
+
+    def test_index_project_walks_tree_once_and_skips_excluded_dirs(self, temp_dir):
+        """All patterns share one walk that never enters excluded directories."""
+        (temp_dir / "roles" / "web" / "tasks").mkdir(parents=True)
+        (temp_dir / "roles" / "web" / "tasks" / "main.yml").write_text("- name: Install\n")
+        (temp_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_dir / "node_modules" / "pkg" / "README.md").write_text("# Vendored\n")
+        (temp_dir / "README.md").write_text("# Project\n")
+
+        engine = MultiRepoRAGEngine(str(temp_dir))
+        engine.config["file_patterns"] = ["*.md", "roles/**/*.yml"]
+        engine.config["exclude_paths"] = ["node_modules"]
+        with patch("core.rag_engine.os.scandir", side_effect=os.scandir) as scandir:
+            engine.index_project()
+
+        walked = [Path(call.args[0]) for call in scandir.call_args_list]
+        assert temp_dir / "node_modules" not in walked
+        assert len(walked) == len(set(walked))
+        assert set(engine.index["documents"]) == {"README.md", os.path.join("roles", "web", "tasks", "main.yml")}
+
+    def test_index_project_embeds_changed_files_in_batches(self, temp_dir):
+        """Document embeddings are requested in bounded batches."""
+        for i in range(5):
+            (temp_dir / f"doc{i}.md").write_text(f"# Doc {i}\n")
+
+        engine = MultiRepoRAGEngine(str(temp_dir))
+        engine.semantic_search_enabled = True
+        engine.embedding_provider = Mock(**{"is_available.return_value": True,
+                                            "get_document_embeddings.return_value": {}})
+        with patch("core.rag_engine._EMBEDDING_BATCH_SIZE", 2):
+            engine.index_project()
+
+        batches = [call.args[0] for call in engine.embedding_provider.get_document_embeddings.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert set().union(*batches) == set(engine.index["documents"])
+
+    def test_pdf_pages_joined_in_order(self, temp_dir):
+        """Extracted PDF pages are joined line-for-line, skipping empty pages."""
+        pages = [Mock(**{"extract_text.return_value": text})
+                 for text in ["# Intro", "", "Error: disk full"]]
+        pdf = Mock(pages=pages)
+        pdf.__enter__ = Mock(return_value=pdf)
+        pdf.__exit__ = Mock(return_value=False)
+        pdfplumber = Mock(**{"open.return_value": pdf})
+        (temp_dir / "guide.pdf").write_bytes(b"%PDF-1.4")
+
+        engine = MultiRepoRAGEngine(str(temp_dir))
+        with patch.dict("sys.modules", {"pdfplumber": pdfplumber}):
+            knowledge = engine._extract_pdf_knowledge(temp_dir / "guide.pdf", "guide.pdf")
+
+        assert [t["line"] for t in knowledge["troubleshooting"]] == [1]
+        metadata = knowledge["concepts"][-1]["metadata"]
+        assert metadata["text_length"] == len("# Intro\nError: disk full\n")
+
+    def test_searchable_text_rebuilt_only_when_hash_changes(self, temp_dir):
+        """Semantic search text is cached per document until its hash changes."""
+        engine = MultiRepoRAGEngine(str(temp_dir))
+        doc_info = {"hash": "h1", "knowledge": {
+            "concepts": [{"name": "Harbor"}, {"name": "  "}],
+            "commands": [{"command": "helm install harbor"}],
+        }}
+
+        assert engine._searchable_text("a.md", doc_info) == "Harbor helm install harbor"
+
+        doc_info["knowledge"]["commands"] = []
+        assert engine._searchable_text("a.md", doc_info) == "Harbor helm install harbor"
+
+        doc_info["hash"] = "h2"
+        assert engine._searchable_text("a.md", doc_info) == "Harbor"
+
+    def test_expand_search_terms_includes_reverse_synonyms(self, temp_dir):
+        """A synonym expands back to its key and the key's other synonyms."""
+        engine = MultiRepoRAGEngine(str(temp_dir))
+
+        expanded = set(engine._expand_search_terms("PVC setup"))
+
+        assert {"pvc", "setup", "persistence", "storage", "volume"} <= expanded
+        assert {"deployment", "rollout"} <= expanded
+        assert "harbor" not in expanded
+
     def test_search_with_content(self, temp_dir):
         """Test search functionality with actual content."""
         engine = MultiRepoRAGEngine(str(temp_dir))
@@ -244,6 +368,44 @@ class TestMultiRepoRAGEngineSimple:
         # May not find matches with empty index, but should not error
         assert len(results) >= 0
 
+    def test_search_keeps_top_scores_in_stable_order(self, temp_dir):
+        """Each category holds the `limit` best matches, ties in index order."""
+        engine = MultiRepoRAGEngine(str(temp_dir))
+        engine.index["documents"] = {
+            "docs/a.md": {"knowledge": {
+                "concepts": [{"name": f"Helm topic {i}", "line": i} for i in range(6)]
+                + [{"name": "helm", "line": 99}]
+            }}
+        }
+        
+        matches = engine.search("helm", limit=3, use_semantic=False)["concept_matches"]
+        
+        assert [m["line"] for m in matches] == [0, 1, 2]
+        assert len(engine.search("helm", limit=10, use_semantic=False)["concept_matches"]) == 7
+
+    def test_search_filters_commands_by_technology(self, temp_dir):
+        """command_tech keeps matching commands only and skips other categories."""
+        engine = MultiRepoRAGEngine(str(temp_dir))
+        engine.index["documents"] = {
+            "docs/k8s.md": {"knowledge": {
+                "commands": [
+                    {"command": "Kubectl Get Pods", "line": 3, "type": "Kubernetes"},
+                    {"command": "helm get pods-chart", "line": 4, "type": "helm"},
+                    {"command": "get pods", "line": 5, "type": "Kubernetes"}
+                ],
+                "concepts": [{"name": "get pods", "line": 1}]
+            }}
+        }
+        
+        results = engine.search("get pods", limit=5, use_semantic=False, command_tech="KUBE")
+        
+        assert [m["line"] for m in results["command_matches"]] == [3, 5]
+        assert results["concept_matches"] == []
+        
+        unfiltered = engine.search("get pods", limit=5, use_semantic=False)
+        assert len(unfiltered["command_matches"]) == 3
+        assert unfiltered["concept_matches"]
+
     def test_config_persistence(self, temp_dir):
         """Test that configuration persists across instances."""
         # Create first engine instance
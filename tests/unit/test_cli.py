@@ -0,0 +1,365 @@
+"""
+Unit tests for the claude-rag command-line interface.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cli
+import cli_handlers
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SRC = REPO_ROOT / "src"
+
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter with src/ importable."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip()
+
+
+class TestCLIStartup:
+    """Test cases for what the CLI loads before dispatching."""
+
+    def test_help_does_not_load_engine(self):
+        """Building the parser and printing help leaves the engine stack unloaded."""
+        output = _run(
+            "import sys, contextlib, io, cli\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    cli.RAGToolkitCLI().parser.print_help()\n"
+            "heavy = ('cli_handlers', 'core.rag_engine', 'utils.session_manager', 'utils.repo_detector')\n"
+            "print([m for m in heavy if m in sys.modules])"
+        )
+        assert output == "[]"
+
+
+def _subcommands(parser):
+    """Names registered on the parser's subcommand group."""
+    group = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    return list(group.choices)
+
+
+class TestParserConstruction:
+    """Test cases for on-demand subparser construction."""
+
+    def test_only_requested_subcommand_is_built(self):
+        """A known subcommand builds just its own subparser."""
+        parser = cli.RAGToolkitCLI()._create_parser(["search", "harbor", "-l", "5"])
+        assert _subcommands(parser) == ["search"]
+        assert parser.parse_args(["search", "harbor", "-l", "5"]).limit == 5
+
+    def test_project_root_value_is_not_taken_as_subcommand(self):
+        """The sniffer skips the value of --project-root."""
+        argv = ["--project-root", "stats", "search", "harbor"]
+        parsed = cli.RAGToolkitCLI()._create_parser(argv).parse_args(argv)
+        assert parsed.project_root == "stats"
+        assert parsed.command == "search"
+
+    def test_top_level_help_builds_everything(self):
+        """Help and unknown commands see the full command list."""
+        for argv in ([], ["--help"], ["bogus"]):
+            parser = cli.RAGToolkitCLI()._create_parser(argv)
+            assert _subcommands(parser) == list(cli._SUBCMD_BUILDERS)
+
+    def test_session_operation_arguments_are_deferred(self):
+        """Session operation arguments are left for the on-demand parser."""
+        argv = ["session", "start", "demo", "-d", "desc"]
+        parsed = cli.RAGToolkitCLI()._create_parser(argv).parse_args(argv)
+        assert parsed.session_command == "start"
+        assert parsed.session_args == ["demo", "-d", "desc"]
+
+
+class TestDispatch:
+    """Test cases for command dispatch tables."""
+
+    def test_every_subcommand_has_a_handler(self):
+        """Each registered subcommand and session operation dispatches somewhere."""
+        assert set(cli._DISPATCH) | {'session'} == set(cli._SUBCMD_BUILDERS)
+        session_targets = [target for _, _, target in cli._SESSION_CMDS.values()]
+        for target in [*cli._DISPATCH.values(), *session_targets]:
+            assert callable(cli._resolve(target))
+
+    def test_engine_is_reused_within_an_invocation(self, tmp_path):
+        """get_engine loads the engine for the project root only once."""
+        app = cli.RAGToolkitCLI()
+        app._root = str(tmp_path)
+        engine = cli_handlers.get_engine(app)
+        assert engine is not None
+        assert cli_handlers.get_engine(app) is engine
+        assert engine.project_root == tmp_path
+
+    def test_engine_is_reused_across_runs_for_the_same_root(self, tmp_path, capsys):
+        """Repeated run() calls share the engine until --project-root changes."""
+        class Engine:
+            index = {}
+
+        app = cli.RAGToolkitCLI()
+        app._root = str(tmp_path)
+        engine = app._engine = Engine()
+        assert app.run(['--project-root', str(tmp_path), 'stats']) == 0
+        assert app.run(['--project-root', str(tmp_path), 'recent']) == 0
+        assert app._engine is engine
+
+        other = tmp_path / 'other'
+        other.mkdir()
+        assert app.run(['--project-root', str(other), 'info']) == 0
+        assert app._engine is None
+
+    def test_stats_reads_index_without_building_engine(self, tmp_path, capsys):
+        """stats only needs index metadata, so no engine is constructed."""
+        rag_dir = tmp_path / '.claude-rag'
+        rag_dir.mkdir()
+        (rag_dir / 'index.json').write_text(
+            '{"repo_type": "ansible", "documents": {"a.md": {}}, "recent_changes": [{"file": "a.md"}]}'
+        )
+
+        app = cli.RAGToolkitCLI()
+        app._root = str(tmp_path)
+        assert cli_handlers.cmd_stats(app, argparse.Namespace()) == 0
+        assert app._engine is None
+
+        out = capsys.readouterr().out
+        assert 'Repository Type: ansible' in out
+        assert 'Recent Changes: 1' in out
+
+    def test_stats_without_index_asks_for_init(self, tmp_path, capsys):
+        """A project with no index reports it instead of creating one."""
+        app = cli.RAGToolkitCLI()
+        app._root = str(tmp_path)
+        assert cli_handlers.cmd_stats(app, argparse.Namespace()) == 1
+        assert "claude-rag init" in capsys.readouterr().out
+        assert not (tmp_path / '.claude-rag').exists()
+
+    def test_unknown_command_returns_error(self, capsys):
+        """An unregistered command name reports an error instead of raising."""
+        assert cli.RAGToolkitCLI()._execute_command(argparse.Namespace(command="bogus")) == 1
+        assert "Unknown command" in capsys.readouterr().out
+
+
+class TestHandlers:
+    """Test cases for command output."""
+
+    def test_troubleshoot_groups_matches_by_type(self, capsys):
+        """Errors, solutions and issues are listed under their own headings."""
+        matches = [
+            {'type': 'solution', 'file': 'a.md', 'line': 1, 'content': 'restart kubelet'},
+            {'type': 'error', 'file': 'b.md', 'line': 2, 'content': 'port 6443 refused'},
+            {'type': 'other', 'file': 'c.md', 'line': 3, 'content': 'ignored entry'},
+        ]
+
+        class Engine:
+            def search(self, query, limit):
+                return {'troubleshooting_matches': matches}
+
+        app = cli.RAGToolkitCLI()
+        app._engine = Engine()
+        assert cli_handlers.cmd_troubleshoot(app, argparse.Namespace(error='6443')) == 0
+
+        out = capsys.readouterr().out
+        assert out.index('Known Errors') < out.index('port 6443') < out.index('Solutions')
+        assert out.index('Solutions') < out.index('restart kubelet')
+        assert 'Related Issues' not in out
+        assert 'ignored entry' not in out
+
+    def test_search_category_filter(self, capsys):
+        """--category limits output to the matching result group."""
+        results = {
+            'concept_matches': [{'file': 'a.md', 'line': 4, 'concept': 'Harbor registry', 'score': 10}],
+            'command_matches': [
+                {'file': 'b.md', 'line': 9, 'command': 'docker login harbor', 'type': 'docker', 'score': 5}
+            ],
+            'configuration_matches': [],
+            'troubleshooting_matches': [],
+            'semantic_matches': [],
+        }
+
+        class Engine:
+            def search(self, query, limit):
+                return results
+
+        app = cli.RAGToolkitCLI()
+        app._engine = Engine()
+        args = argparse.Namespace(query='harbor', limit=10, category='concepts')
+        assert cli_handlers.cmd_search(app, args) == 0
+
+        out = capsys.readouterr().out
+        assert '1. [a.md:4] Harbor registry' in out
+        assert 'docker login' not in out
+        assert 'Total results: 1' in out
+
+    def test_session_list_groups_and_filters_by_status(self, capsys):
+        """Sessions are grouped in status order and --status drops the rest."""
+        sessions = [
+            {'session_id': 'c' * 36, 'name': 'done', 'start_time': '2024-01-01T09:00:00', 'status': 'completed'},
+            {'session_id': 'a' * 36, 'name': 'live', 'start_time': '2024-01-02T10:00:00', 'status': 'active'},
+            {'session_id': 'p' * 36, 'name': 'held', 'start_time': '2024-01-03T11:00:00', 'status': 'paused'},
+        ]
+
+        class Manager:
+            def list_sessions(self):
+                return sessions
+
+        assert cli_handlers.session_list(Manager(), argparse.Namespace(status=None)) == 0
+        out = capsys.readouterr().out
+        assert 'Sessions (3)' in out
+        assert out.index('live') < out.index('held') < out.index('done')
+        assert 'aaaaaaaa - live (2024-01-02 10:00:00)' in out
+
+        assert cli_handlers.session_list(Manager(), argparse.Namespace(status='paused')) == 0
+        out = capsys.readouterr().out
+        assert 'Sessions (1)' in out
+        assert 'held' in out and 'live' not in out
+
+        assert cli_handlers.session_list(Manager(), argparse.Namespace(status='cancelled')) == 0
+        assert "No sessions found with status 'cancelled'" in capsys.readouterr().out
+
+    def test_json_flag_emits_raw_results(self, capsys):
+        """--json writes the engine results as JSON instead of formatted text."""
+        import json
+
+        matches = [{'type': 'error', 'file': 'b.md', 'line': 2, 'content': 'port 6443 refused'}]
+
+        class Engine:
+            def search(self, query, limit):
+                return {'troubleshooting_matches': matches}
+
+        app = cli.RAGToolkitCLI()
+        app._engine = Engine()
+        assert app.run(['troubleshoot', '6443', '--json']) == 0
+
+        assert json.loads(capsys.readouterr().out) == matches
+
+    def test_json_flag_rejected_by_text_only_commands(self, capsys):
+        """Commands without JSON output fail fast instead of printing text."""
+        for argv in (['init', '--json'], ['--json', 'reindex'], ['--json', 'session', 'list'],
+                     ['session', 'list', '--json']):
+            with pytest.raises(SystemExit) as exc:
+                cli.RAGToolkitCLI().run(argv)
+            assert exc.value.code == 2
+            assert '--json' in capsys.readouterr().err
+
+    def test_init_appends_only_missing_gitignore_entries(self, tmp_path, monkeypatch, capsys):
+        """init keeps existing .gitignore entries and adds the rest once."""
+        monkeypatch.chdir(tmp_path)
+        gitignore = tmp_path / '.gitignore'
+        gitignore.write_text("*.pyc\n# Claude RAG generated files\n.claude-rag/index.json\n")
+
+        args = argparse.Namespace(force=False, repo_type=None)
+        assert cli_handlers.cmd_init(cli.RAGToolkitCLI(), args) == 0
+
+        lines = gitignore.read_text().splitlines()
+        assert lines.count('.claude-rag/index.json') == 1
+        assert lines.count('# Claude RAG generated files') == 1
+        assert '.claude-rag/embeddings/' in lines
+        assert 'Added 5 Claude RAG entries' in capsys.readouterr().out
+
+    def test_init_rewrites_config_only_when_repo_type_changes(self, tmp_path, monkeypatch, capsys):
+        """--repo-type matching the stored type does not rewrite config.json."""
+        import json
+
+        monkeypatch.chdir(tmp_path)
+        config_path = tmp_path / '.claude-rag' / 'config.json'
+
+        args = argparse.Namespace(force=True, repo_type='ansible')
+        assert cli_handlers.cmd_init(cli.RAGToolkitCLI(), args) == 0
+        assert json.loads(config_path.read_text())['repo_type'] == 'ansible'
+
+        writes = []
+        monkeypatch.setattr(cli_handlers, '_write_atomic', lambda path, data: writes.append(path))
+        assert cli_handlers.cmd_init(cli.RAGToolkitCLI(), args) == 0
+        assert writes == []
+        assert not list(config_path.parent.glob('*.tmp'))
+
+    def test_write_atomic_preserves_file_mode(self, tmp_path):
+        """Replacing a file keeps its permissions; new files follow the umask."""
+        import stat
+
+        existing = tmp_path / 'config.json'
+        existing.write_text('{}')
+        existing.chmod(0o640)
+        cli_handlers._write_atomic(existing, b'{"a": 1}')
+        assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+        assert existing.read_bytes() == b'{"a": 1}'
+
+        umask = os.umask(0o022)
+        try:
+            created = tmp_path / 'new.json'
+            cli_handlers._write_atomic(created, b'{}')
+        finally:
+            os.umask(umask)
+        assert stat.S_IMODE(created.stat().st_mode) == 0o644
+
+    def test_setup_mcp_merges_into_existing_config(self, tmp_path, capsys):
+        """setup-mcp keeps existing servers and adds one for the project."""
+        import json
+
+        config_dir = tmp_path / 'claude'
+        config_dir.mkdir()
+        (config_dir / 'mcp.json').write_text(json.dumps({'servers': {'other': {'command': 'x'}}}))
+
+        app = cli.RAGToolkitCLI()
+        app._root = str(tmp_path)
+        assert cli_handlers.cmd_setup_mcp(app, argparse.Namespace(claude_config_dir=str(config_dir))) == 0
+
+        servers = json.loads((config_dir / 'mcp.json').read_text())['servers']
+        assert set(servers) == {'other', f'claude-rag-{tmp_path.name}'}
+
+    def test_import_skips_pathlib_and_typing(self):
+        """The launcher module itself does not import pathlib or typing."""
+        output = _run(
+            "import sys\n"
+            "before = {'pathlib', 'typing'} & set(sys.modules)\n"
+            "import cli\n"
+            "print(sorted(({'pathlib', 'typing'} & set(sys.modules)) - before))"
+        )
+        assert output == "[]"
+
+    def test_examples_epilog_only_when_help_can_be_shown(self):
+        """Plain command runs skip the help-only formatter and epilog."""
+        assert cli.RAGToolkitCLI()._create_parser(["stats"]).epilog is None
+        assert cli.RAGToolkitCLI()._create_parser(["--help"]).epilog == cli._EXAMPLES
+        assert cli.RAGToolkitCLI()._create_parser([]).epilog == cli._EXAMPLES
+
+    def test_setup_mcp_prefers_xdg_config_home(self, tmp_path, monkeypatch):
+        """Without --claude-config-dir, $XDG_CONFIG_HOME/claude is used first."""
+        home = tmp_path / 'home'
+        (home / '.claude').mkdir(parents=True)
+        xdg_dir = tmp_path / 'xdg' / 'claude'
+        xdg_dir.mkdir(parents=True)
+        monkeypatch.setenv('HOME', str(home))
+        monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'xdg'))
+
+        app = cli.RAGToolkitCLI()
+        app._root = str(tmp_path)
+        assert cli_handlers.cmd_setup_mcp(app, argparse.Namespace(claude_config_dir=None)) == 0
+        assert (xdg_dir / 'mcp.json').exists()
+        assert not (home / '.claude' / 'mcp.json').exists()
+
+    def test_debug_flag_accepted_before_or_after_subcommand(self):
+        """--debug is a real option in either position and defaults to off."""
+        for argv, expected in ((["stats"], False), (["--debug", "stats"], True), (["stats", "--debug"], True)):
+            parsed = cli.RAGToolkitCLI()._create_parser(argv).parse_args(argv)
+            assert parsed.debug is expected
+
+    def test_static_help_covers_parser(self, capsys):
+        """The argparse-free help lists every command and top-level option."""
+        assert cli.RAGToolkitCLI().run(["--help"]) == 0
+        text = capsys.readouterr().out
+
+        parser = cli.RAGToolkitCLI().parser
+        for action in parser._actions:
+            for option in action.option_strings:
+                assert option in text
+        for name, (help_text, _) in cli._SUBCMD_BUILDERS.items():
+            assert f"{name:<20}{help_text}" in text
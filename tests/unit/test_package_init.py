@@ -0,0 +1,74 @@
+"""
+Unit tests for the top-level package namespace.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter so sys.modules starts clean."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip()
+
+
+class TestPackageInit:
+    """Test cases for lazy attribute loading in src/__init__.py."""
+
+    def test_import_does_not_load_engine(self):
+        """Importing the package should not import the RAG engine."""
+        output = _run("import sys, src; print('src.core.rag_engine' in sys.modules)")
+        assert output == "False"
+
+    def test_lazy_attribute_resolves(self):
+        """Accessing a public name imports it from its submodule."""
+        output = _run("import src; print(src.MultiRepoRAGEngine.__name__)")
+        assert output == "MultiRepoRAGEngine"
+
+    def test_dir_lists_lazy_names(self):
+        """dir() should advertise lazy names for completion."""
+        output = _run("import src; print(all(n in dir(src) for n in src.__all__))")
+        assert output == "True"
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError."""
+        import src
+        with pytest.raises(AttributeError):
+            src.does_not_exist
+
+
+class TestSubpackageInit:
+    """Test cases for lazy attribute loading in the shipped subpackages."""
+
+    def test_import_core_does_not_load_modules(self):
+        """Importing core should not import the engine or the extractor."""
+        output = _run(
+            "import sys, src.core; "
+            "print(any(m in sys.modules for m in ('src.core.rag_engine', 'src.core.knowledge_extractor')))"
+        )
+        assert output == "False"
+
+    def test_utils_submodule_does_not_load_detector(self):
+        """Importing a utils helper should not drag in RepositoryDetector."""
+        output = _run("import sys, src.utils._json; print('src.utils.repo_detector' in sys.modules)")
+        assert output == "False"
+
+    def test_lazy_attributes_resolve(self):
+        """Package-level names still resolve from their submodules."""
+        output = _run(
+            "import src.core, src.utils, src.integrations; "
+            "print(src.core.KnowledgeExtractor.__name__, src.utils.RepositoryDetector.__name__, "
+            "src.integrations.CLIInterface.__name__)"
+        )
+        assert output == "KnowledgeExtractor RepositoryDetector CLIInterface"
@@ -0,0 +1,54 @@
+"""
+Packaging consistency tests.
+"""
+
+from pathlib import Path
+
+import pytest
+from setuptools import find_packages
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = pytest.importorskip("tomli")
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Subtrees that must never end up in the wheel
+NON_SHIPPED = ("tests", "docs", "examples", "benchmarks")
+
+
+def _pyproject():
+    """Load pyproject.toml."""
+    with open(REPO_ROOT / "pyproject.toml", "rb") as f:
+        return tomllib.load(f)
+
+
+class TestPackaging:
+    """Test cases for the distribution metadata."""
+
+    def test_declared_packages_match_source_tree(self):
+        """The hard-coded package list must not drift from src/."""
+        declared = _pyproject()["tool"]["setuptools"]["packages"]
+        exclude = [pattern for pkg in NON_SHIPPED for pattern in (pkg, f"{pkg}.*")]
+        discovered = find_packages(where=str(REPO_ROOT / "src"), exclude=exclude)
+        assert sorted(declared) == sorted(discovered)
+
+    def test_no_non_runtime_packages_shipped(self):
+        """Tests, docs and examples stay out of the wheel."""
+        declared = _pyproject()["tool"]["setuptools"]["packages"]
+        assert not [pkg for pkg in declared if pkg.split(".")[0] in NON_SHIPPED]
+
+    def test_console_script_module_is_shipped(self):
+        """The module behind the claude-rag entry point must be installed."""
+        config = _pyproject()
+        module = config["project"]["scripts"]["claude-rag"].split(":")[0]
+        assert module in config["tool"]["setuptools"]["py-modules"]
+
+    def test_version_is_single_sourced(self):
+        """The build reads the version from utils._version, not a literal."""
+        config = _pyproject()
+        assert "version" not in config["project"]
+        assert config["tool"]["setuptools"]["dynamic"]["version"] == {
+            "attr": "utils._version.__version__"
+        }
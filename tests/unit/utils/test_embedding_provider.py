@@ -0,0 +1,55 @@
+"""
+Unit tests for the embedding provider caches.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from unittest.mock import Mock
+
+import utils.embedding_provider as embedding_provider
+from utils.embedding_provider import EmbeddingProvider
+
+
+def _fake_encode(texts, **kwargs):
+    """Deterministic stand-in for SentenceTransformer.encode."""
+    return [np.array([float(len(text)), 1.0]) for text in texts]
+
+
+@pytest.fixture
+def provider(temp_dir, monkeypatch):
+    """An EmbeddingProvider backed by a stub model."""
+    monkeypatch.setattr(embedding_provider, "SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr(embedding_provider, "SentenceTransformer",
+                        lambda name: Mock(**{"encode.side_effect": _fake_encode}))
+    return EmbeddingProvider(str(temp_dir))
+
+
+class TestEmbeddingProvider:
+    """Test cases for EmbeddingProvider caching."""
+
+    def test_identical_text_reuses_embedding(self, provider):
+        """A copy of an embedded document does not run the model again."""
+        first = provider.get_document_embedding("a.md", "x")
+        copy = provider.get_document_embedding("b.md", "x")
+
+        assert provider.model.encode.call_count == 1
+        assert copy is first
+
+    def test_edited_document_is_not_reused_for_old_text(self, provider):
+        """Copy-then-edit: the copy keeps an embedding of its own text."""
+        provider.get_document_embedding("a.md", "x")
+        provider.get_document_embedding("a.md", "yyyyyyyy")
+
+        assert list(provider.get_document_embedding("b.md", "x")) == [1.0, 1.0]
+        assert list(provider.get_document_embeddings({"c.md": "x"})["c.md"]) == [1.0, 1.0]
+
+    def test_cached_query_embedding_is_read_only(self, provider):
+        """Cache hits share one array, so callers cannot modify it."""
+        embedding = provider.get_query_embedding("harbor")
+
+        assert provider.get_query_embedding("harbor") is embedding
+        assert provider.model.encode.call_count == 1
+        with pytest.raises(ValueError):
+            embedding[0] = 0.0
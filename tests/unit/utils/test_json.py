@@ -0,0 +1,29 @@
+"""
+Unit tests for the JSON serialization shim.
+"""
+
+import pytest
+
+from utils import _json
+
+
+class TestJsonShim:
+    """Test cases for utils._json."""
+
+    def test_dumps_returns_bytes(self):
+        """dumps() yields bytes for every backend so callers can write binary."""
+        assert isinstance(_json.dumps({"a": 1}), bytes)
+
+    def test_roundtrip_preserves_data(self):
+        """Indented output still round-trips, including non-ASCII text."""
+        data = {"name": "café", "items": [1, 2, {"nested": True}], "none": None}
+        assert _json.loads(_json.dumps(data, indent=True)) == data
+
+    def test_loads_accepts_str(self):
+        """loads() accepts text as well as bytes."""
+        assert _json.loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_invalid_input_raises_decode_error(self):
+        """Malformed input raises the exported JSONDecodeError."""
+        with pytest.raises(_json.JSONDecodeError):
+            _json.loads(b"{not json")
@@ -380,6 +380,27 @@ class TestSessionManager:
         assert "Goal 1" in report
         assert "Made progress" in report
 
+    def test_stream_session_report_matches_generated(self, temp_dir):
+        """Streaming writes exactly the text generate_session_report returns."""
+        import io
+        
+        manager = SessionManager(str(temp_dir))
+        manager._save_session(SessionState(
+            session_id="test-id",
+            name="Test Session",
+            start_time="2024-01-01T10:00:00",
+            initial_commit="abc123def",
+            objectives=["Goal 1"],
+            progress_log=[{"timestamp": "2024-01-01T10:30:00", "notes": "Made progress"}]
+        ))
+        
+        out = io.StringIO()
+        assert manager.stream_session_report("test-id", out) is True
+        assert out.getvalue() == manager.generate_session_report("test-id")
+        assert out.getvalue().startswith("# Session Report: Test Session\n")
+        
+        assert manager.stream_session_report("nonexistent", io.StringIO()) is False
+
     def test_generate_report_nonexistent_session(self, temp_dir):
         """Test generating report for nonexistent session."""
         manager = SessionManager(str(temp_dir))
@@ -417,4 +438,23 @@ class TestSessionManager:
         """Test getting details for nonexistent session."""
         manager = SessionManager(str(temp_dir))
         session = manager.get_session_details("nonexistent")
-        assert session is None
\ No newline at end of file
+        assert session is None
+
+    def test_session_lookups_are_cached(self, temp_dir):
+        """Repeated lookups of one session only read its file once."""
+        manager = SessionManager(str(temp_dir))
+        manager._save_session(SessionState(
+            session_id="test-id",
+            name="Test Session",
+            start_time="2024-01-01T10:00:00"
+        ))
+        with open(manager.current_session_file, 'w') as f:
+            f.write("test-id")
+        
+        # A fresh manager has to read the file once, then serves it from memory
+        fresh = SessionManager(str(temp_dir))
+        session = fresh.get_session_details("test-id")
+        (fresh.sessions_dir / "test-id.json").unlink()
+        
+        assert fresh.get_session_details("test-id") is session
+        assert fresh.get_current_session() is session